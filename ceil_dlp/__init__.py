@@ -1,12 +1,24 @@
 """ceil-dlp: Data Loss Prevention plugin for LiteLLM."""
 
+import importlib
 import logging
 import os
 import sys
+from typing import TYPE_CHECKING, Any
 
 from rich.logging import RichHandler
 
-from ceil_dlp.middleware import CeilDLPHandler, create_handler
+if TYPE_CHECKING:
+    from ceil_dlp.middleware import CeilDLPHandler, create_handler
+    from ceil_dlp.model_warmup import warmup
+
+# The public API is resolved on first access (PEP 562), so importing the package or a
+# submodule such as ceil_dlp.config does not also load LiteLLM, Presidio and the models.
+_LAZY_ATTRIBUTES = {
+    "CeilDLPHandler": "ceil_dlp.middleware",
+    "create_handler": "ceil_dlp.middleware",
+    "warmup": "ceil_dlp.model_warmup",
+}
 
 
 def _setup_logger() -> None:
@@ -38,10 +50,31 @@ def _setup_logger() -> None:
     root_logger.setLevel(log_level)
 
 
+def __getattr__(name: str) -> Any:
+    """Import the public API lazily on first attribute access.
+
+    Args:
+        name: Attribute name being looked up on the package.
+
+    Returns:
+        The requested attribute from its defining module.
+
+    Raises:
+        AttributeError: If name is not part of the lazily loaded public API.
+    """
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
 # Setup logger when package is imported
 _setup_logger()
 
 __all__ = [
     "CeilDLPHandler",
     "create_handler",
+    "warmup",
 ]
@@ -7,6 +7,10 @@ from typing import Literal
 import yaml
 from pydantic import BaseModel, Field, model_validator
 
+# libyaml's C loader parses many times faster than the pure-Python SafeLoader,
+# with the same safe subset of YAML. PyYAML builds without libyaml fall back to it.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class ModelRules(BaseModel):
     """Model matching rules for policy application."""
@@ -50,6 +54,11 @@ class Config(BaseModel):
         description="NER model strength: 1=en_core_web_lg (fastest), 2=spaCy+transformer ensemble (balanced), 3=spaCy+transformer+GLiNER ensemble (best coverage, slower). Default is 3.",
     )
 
+    warmup: bool = Field(
+        default=False,
+        description="Load NER and OCR models in a background thread when the handler starts, so the first request does not pay model load time.",
+    )
+
     @model_validator(mode="after")
     def override_mode_from_env(self) -> "Config":
         """Override mode from environment variable if set."""
@@ -70,7 +79,7 @@ class Config(BaseModel):
             Config instance
         """
         with open(config_path) as f:
-            data = yaml.safe_load(f) or {}
+            data = yaml.load(f, Loader=_YAML_LOADER) or {}
         return cls.model_validate(data)
 
     @classmethod
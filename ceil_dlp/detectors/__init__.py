@@ -1,5 +1,15 @@
 """PII detection modules."""
 
-from ceil_dlp.detectors.text_detector import detect_pii_in_text
+from ceil_dlp.detectors.text_detector import (
+    detect_pii_in_text,
+    detect_pii_in_text_batch,
+    has_pii_in_text,
+    may_have_pii_in_text,
+)
 
-__all__ = ["detect_pii_in_text"]
+__all__ = [
+    "detect_pii_in_text",
+    "detect_pii_in_text_batch",
+    "has_pii_in_text",
+    "may_have_pii_in_text",
+]
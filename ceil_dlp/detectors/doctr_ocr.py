@@ -2,6 +2,9 @@
 
 import io
 import logging
+import os
+import threading
+from collections.abc import Sequence
 from functools import lru_cache
 from typing import Any
 
@@ -15,6 +18,36 @@ from ceil_dlp.utils import image_to_pil_image
 logger = logging.getLogger(__name__)
 
 
+def get_ocr_device() -> str:
+    """Get the torch device docTR OCR models run on.
+
+    Uses CEIL_DLP_OCR_DEVICE if set (e.g. "cpu", "cuda", "cuda:1"), otherwise CUDA when a
+    GPU is available and the CPU if not.
+    """
+    device = os.getenv("CEIL_DLP_OCR_DEVICE")
+    if device:
+        return device
+    try:
+        import torch
+
+        return "cuda" if torch.cuda.is_available() else "cpu"
+    except ImportError:
+        return "cpu"
+
+
+# Serializes lazy docTR model loading, so images OCR'd from several threads load it once
+_model_lock = threading.Lock()
+
+
+def _reset_model_lock_after_fork() -> None:
+    """Give a forked worker a fresh model lock, in case the parent forked mid-load."""
+    global _model_lock
+    _model_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_model_lock_after_fork)
+
+
 class DocTROCREngine(OCR):
     """OCR engine using docTR (Document Text Recognition) for better accuracy on complex documents."""
 
@@ -40,15 +73,21 @@ class DocTROCREngine(OCR):
     def model(self):
         """Lazy-load the OCR model to avoid expensive initialization at import time."""
         if self._model is None:
-            logger.info(
-                f"initializing docTR OCR model ({self.model_name}) (this may take a moment on first use)..."
-            )
-            self._model = ocr_predictor(
-                det_arch=self.det_arch,
-                reco_arch=self.reco_arch,
-                pretrained=True,
-            )
-            logger.info(f"docTR OCR model ({self.model_name}) initialized successfully")
+            # Images may be OCR'd from several threads; only one of them should load the model
+            with _model_lock:
+                if self._model is None:
+                    logger.info(
+                        f"initializing docTR OCR model ({self.model_name}) (this may take a moment on first use)..."
+                    )
+                    device = get_ocr_device()
+                    self._model = ocr_predictor(
+                        det_arch=self.det_arch,
+                        reco_arch=self.reco_arch,
+                        pretrained=True,
+                    ).to(device)
+                    logger.info(
+                        f"docTR OCR model ({self.model_name}) initialized successfully on {device}"
+                    )
         return self._model
 
     def perform_ocr(self, image: object, **_kwargs) -> dict:
@@ -61,58 +100,65 @@ class DocTROCREngine(OCR):
         :param _kwargs: Additional parameters (currently unused, for API compatibility)
 
         :return: Dictionary in Tesseract format with keys: level, page_num, block_num,
-                 par_num, line_num, word_num, left, top, width, height, conf, text
+                 par_num, line_num, word_num, left, top, width, height, conf, text.
+                 Has no words if OCR fails.
         """
         try:
-            # Convert input to PIL Image if needed
-            pil_image: Image.Image = image_to_pil_image(image)
+            return self.perform_ocr_batch([image])[0]
+        except Exception as e:
+            logger.error(f"Error performing OCR with docTR: {e}", exc_info=True)
+            # Return empty structure on error
+            return _empty_ocr_result()
+
+    def perform_ocr_batch(self, images: Sequence[object]) -> list[dict]:
+        """Perform OCR on several images with a single docTR model call.
+
+        docTR resizes and batches pages internally, so recognizing all images in one call
+        amortizes per-call overhead and keeps a GPU busy, unlike one call per image.
 
-            # Convert PIL Image to bytes for docTR
-            # DocumentFile.from_images expects bytes, str (file path), or Path
+        :param images: PIL Images, numpy arrays, or file paths (str) to be processed
+
+        :return: One Tesseract-format dictionary per image, in the same order (see perform_ocr)
+
+        :raises Exception: If OCR fails. Unlike perform_ocr, failures are raised rather than
+                 returned as results without words, so callers can tell them apart from
+                 images without text and don't cache them
+        """
+        if not images:
+            return []
+        # Convert inputs to PIL Images if needed
+        pil_images: list[Image.Image] = [image_to_pil_image(image) for image in images]
+
+        # Convert PIL Images to bytes for docTR
+        # DocumentFile.from_images expects bytes, str (file path), or Path
+        pages_bytes = []
+        for pil_image in pil_images:
             img_bytes = io.BytesIO()
             pil_image.save(img_bytes, format="PNG")
-            img_bytes.seek(0)
+            pages_bytes.append(img_bytes.getvalue())
 
-            # Create DocumentFile from bytes
-            # docTR expects a list of images (one per page)
-            doc = DocumentFile.from_images([img_bytes.getvalue()])
+        # Create DocumentFile from bytes
+        # docTR expects a list of images (one per page)
+        doc = DocumentFile.from_images(pages_bytes)
 
-            # Run OCR
-            result = self.model(doc)
+        # Run OCR
+        result = self.model(doc)
 
-            # Get image dimensions for coordinate conversion
-            img_width, img_height = pil_image.size
+        # Convert each page using its image dimensions for coordinate conversion
+        return [
+            self._convert_pages_to_tesseract_format([page], *pil_image.size)
+            for page, pil_image in zip(result.pages, pil_images, strict=True)
+        ]
 
-            # Convert docTR's nested structure to Tesseract-compatible flat format
-            return self._convert_doctr_to_tesseract_format(result, img_width, img_height)
-
-        except Exception as e:
-            logger.error(f"Error performing OCR with docTR: {e}", exc_info=True)
-            # Return empty structure on error
-            return {
-                "level": [],
-                "page_num": [],
-                "block_num": [],
-                "par_num": [],
-                "line_num": [],
-                "word_num": [],
-                "left": [],
-                "top": [],
-                "width": [],
-                "height": [],
-                "conf": [],
-                "text": [],
-            }
-
-    def _convert_doctr_to_tesseract_format(
-        self, doctr_result, img_width: int, img_height: int
+    def _convert_pages_to_tesseract_format(
+        self, pages: Sequence[Any], img_width: int, img_height: int
     ) -> dict:
-        """Convert docTR's nested document structure to Tesseract's flat dictionary format.
+        """Convert docTR's nested page structure to Tesseract's flat dictionary format.
 
         docTR structure: Document → Pages → Blocks → Lines → Words
         Tesseract format: flat lists with hierarchy encoded in level/page_num/block_num/etc.
 
-        :param doctr_result: docTR Document object
+        :param pages: docTR Page objects (the pages of a docTR Document)
         :param img_width: Image width in pixels
         :param img_height: Image height in pixels
 
@@ -133,7 +179,7 @@ class DocTROCREngine(OCR):
         texts = []
 
         # Process each page
-        for page_idx, page in enumerate(doctr_result.pages, start=1):
+        for page_idx, page in enumerate(pages, start=1):
             page_num = page_idx
 
             # Add page-level entry (level 1)
@@ -263,6 +309,24 @@ class DocTROCREngine(OCR):
         }
 
 
+def _empty_ocr_result() -> dict:
+    """Tesseract-format OCR result with no words, returned when OCR fails."""
+    return {
+        "level": [],
+        "page_num": [],
+        "block_num": [],
+        "par_num": [],
+        "line_num": [],
+        "word_num": [],
+        "left": [],
+        "top": [],
+        "width": [],
+        "height": [],
+        "conf": [],
+        "text": [],
+    }
+
+
 @lru_cache(maxsize=1)
 def get_doctr_ocr_engine() -> DocTROCREngine:
     """Get cached docTR OCR engine instance (lighter model).
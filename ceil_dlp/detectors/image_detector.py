@@ -1,8 +1,14 @@
 """Image PII detection using Presidio Image Redactor."""
 
+import hashlib
 import logging
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
 from functools import lru_cache
 from pathlib import Path
+from typing import Any
 
 from PIL import Image
 from presidio_image_redactor import ImageAnalyzerEngine
@@ -15,6 +21,55 @@ from ceil_dlp.utils import image_to_pil_image
 logger = logging.getLogger(__name__)
 
 
+def image_detection_enabled() -> bool:
+    """Check whether image PII detection is enabled.
+
+    Text-only deployments can set CEIL_DLP_ENABLE_IMAGE_PII=0 so images are never
+    OCR'd and the OCR models are never loaded.
+    """
+    return os.getenv("CEIL_DLP_ENABLE_IMAGE_PII", "1") == "1"
+
+
+def ocr_concurrency() -> int:
+    """Get the maximum number of images OCR'd at once.
+
+    Uses CEIL_DLP_OCR_CONCURRENCY if set, otherwise the number of CPUs. Lower it to bound
+    memory use, e.g. when OCR runs on a GPU with little memory.
+    """
+    value = os.getenv("CEIL_DLP_OCR_CONCURRENCY")
+    if value:
+        try:
+            return max(int(value), 1)
+        except ValueError:
+            logger.warning(f"Ignoring invalid CEIL_DLP_OCR_CONCURRENCY: {value!r}")
+    return os.cpu_count() or 1
+
+
+# Larger images are downscaled before OCR; OCR time grows with pixel count and
+# text in a 2000px-wide image is still comfortably legible
+MAX_OCR_IMAGE_SIDE = 2000
+
+
+def _prepare_image_for_ocr(image: Image.Image) -> Image.Image:
+    """Downscale oversized images and normalize unusual modes before OCR.
+
+    The caller's image is never modified; a resized or converted copy is returned instead.
+
+    Args:
+        image: PIL Image to prepare
+
+    Returns:
+        PIL Image no larger than MAX_OCR_IMAGE_SIDE on either side, in L or RGB mode.
+    """
+    if max(image.size) > MAX_OCR_IMAGE_SIDE:
+        image = image.copy()
+        image.thumbnail((MAX_OCR_IMAGE_SIDE, MAX_OCR_IMAGE_SIDE), Image.Resampling.LANCZOS)
+    # Palette, CMYK, alpha etc. images are converted so OCR sees a plain grayscale page
+    if image.mode not in ("L", "RGB"):
+        image = image.convert("L")
+    return image
+
+
 @lru_cache(maxsize=3)  # Cache up to 3 analyzers (one per strength level: 1, 2, or 3)
 def get_image_analyzer(ner_strength: int = 1) -> ImageAnalyzerEngine:
     """
@@ -107,6 +162,140 @@ def get_doctr_heavy_image_analyzer(ner_strength: int = 1) -> ImageAnalyzerEngine
     return ImageAnalyzerEngine(analyzer_engine=analyzer, ocr=ocr_engine)
 
 
+# Chat sessions often resend the same screenshot on every turn, so OCR results are cached
+# by image content
+_IMAGE_DETECTION_CACHE_SIZE = 256
+_image_detection_cache: OrderedDict[bytes, dict[str, list[PatternMatch]]] = OrderedDict()
+_image_detection_cache_lock = threading.Lock()
+
+
+def _reset_image_detection_cache_lock_after_fork() -> None:
+    """Give a forked worker a fresh cache lock, in case the parent forked while it was held."""
+    global _image_detection_cache_lock
+    _image_detection_cache_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_image_detection_cache_lock_after_fork)
+
+
+def _image_digest(data: bytes) -> bytes:
+    """Get a content digest used as the image detection cache key."""
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _get_cached_image_detections(key: bytes) -> dict[str, list[PatternMatch]] | None:
+    """Get cached detections for an image digest, marking them most recently used."""
+    with _image_detection_cache_lock:
+        detections = _image_detection_cache.get(key)
+        if detections is not None:
+            _image_detection_cache.move_to_end(key)
+        return detections
+
+
+def _cache_image_detections(key: bytes, detections: dict[str, list[PatternMatch]]) -> None:
+    """Cache detections for an image digest, evicting the least recently used entry."""
+    with _image_detection_cache_lock:
+        _image_detection_cache[key] = detections
+        _image_detection_cache.move_to_end(key)
+        if len(_image_detection_cache) > _IMAGE_DETECTION_CACHE_SIZE:
+            _image_detection_cache.popitem(last=False)
+
+
+def _image_results_to_detections(analyzer_results: list[Any]) -> dict[str, list[PatternMatch]]:
+    """Convert Presidio image analyzer results to our PatternMatch format."""
+    results: dict[str, list[PatternMatch]] = {}
+
+    # Process Presidio results (standard PII types + custom secrets via PatternRecognizers)
+    if analyzer_results:
+        for entity in analyzer_results:
+            # Map Presidio entity type to our PII type
+            # This includes both standard Presidio types and our custom secret types
+            # (the lowercase fallback is only built for unmapped entity types)
+            pii_type = PRESIDIO_TO_PII_TYPE.get(entity.entity_type) or entity.entity_type.lower()
+
+            # Note: entity.start and entity.end are positions in the OCR-extracted text,
+            # not image coordinates. For image redaction, Presidio Image Redactor
+            # handles the coordinate mapping internally.
+            # We use a placeholder text since we don't have the actual OCR text here
+            match_text = f"[{pii_type}_detected_in_image]"
+
+            results.setdefault(pii_type, []).append((match_text, entity.start, entity.end))
+
+    return results
+
+
+def _analyze_image(image: Image.Image) -> dict[str, list[PatternMatch]]:
+    """Run OCR and PII detection on a prepared image, for all PII types.
+
+    Goes through the batch path rather than ImageAnalyzerEngine.analyze, whose OCR returns
+    no words on failure, so a failed OCR pass raises instead of looking like an image
+    without PII and being cached as one.
+    """
+    return _analyze_images([image])[0]
+
+
+def _analyze_images(images: list[Image.Image]) -> list[dict[str, list[PatternMatch]]]:
+    """Run OCR on prepared images in one batch, then PII detection on each, for all PII types.
+
+    Mirrors ImageAnalyzerEngine.analyze, except that OCR for all images is a single docTR
+    model call instead of one call per image.
+    """
+    image_analyzer = get_image_analyzer()
+    ocr_results = get_doctr_ocr_engine().perform_ocr_batch(images)
+
+    all_detections: list[dict[str, list[PatternMatch]]] = []
+    for ocr_result in ocr_results:
+        ocr_result = image_analyzer.remove_space_boxes(ocr_result)
+        text = image_analyzer.ocr.get_text_from_ocr_dict(ocr_result)
+        text_results = image_analyzer.analyzer_engine.analyze(text=text, language="en")
+        analyzer_results = image_analyzer.map_analyzer_results_to_bounding_boxes(
+            text_results, ocr_result, text, []
+        )
+        all_detections.append(_image_results_to_detections(analyzer_results))
+    return all_detections
+
+
+def _lookup_image(
+    image_data: bytes | str | Path | Image.Image,
+) -> tuple[bytes, dict[str, list[PatternMatch]] | None, Image.Image | None]:
+    """Look up cached detections for an image, loading the image only if they aren't cached.
+
+    Returns:
+        Tuple of (cache_key, detections, image), where detections is None on a cache miss
+        and image is the loaded image, or None if it didn't need loading.
+    """
+    # Encoded images can be looked up before paying for decoding; other inputs are
+    # keyed on their pixels once loaded
+    if isinstance(image_data, bytes):
+        cache_key = _image_digest(image_data)
+        detections = _get_cached_image_detections(cache_key)
+        if detections is not None:
+            return cache_key, detections, None
+
+    # Load image
+    image = image_to_pil_image(image_data)
+    if not isinstance(image_data, Image.Image):
+        # Read the pixels now so the underlying file handle is released
+        image.load()
+    if not isinstance(image_data, bytes):
+        cache_key = _image_digest(f"{image.mode}:{image.size}".encode() + image.tobytes())
+        detections = _get_cached_image_detections(cache_key)
+        if detections is not None:
+            return cache_key, detections, None
+    return cache_key, None, image
+
+
+def _filter_detections(
+    detections: dict[str, list[PatternMatch]], enabled_types: set[str] | None
+) -> dict[str, list[PatternMatch]]:
+    """Filter by enabled types if specified, copying so the cached lists stay untouched."""
+    return {
+        pii_type: list(matches)
+        for pii_type, matches in detections.items()
+        if not enabled_types or pii_type in enabled_types
+    }
+
+
 def detect_pii_in_image(
     image_data: bytes | str | Path | Image.Image, enabled_types: set[str] | None = None
 ) -> dict[str, list[PatternMatch]]:
@@ -124,47 +313,108 @@ def detect_pii_in_image(
 
     Returns:
         Dictionary mapping PII type to list of matches (same format as text detection).
-        Returns empty dict if image processing fails.
+        Returns empty dict if image processing fails or image detection is disabled.
     """
+    if not image_detection_enabled():
+        return {}
+    detections = _try_detect_pii_in_image(image_data, enabled_types)
+    return {} if detections is None else detections
+
+
+def _try_detect_pii_in_image(
+    image_data: bytes | str | Path | Image.Image, enabled_types: set[str] | None
+) -> dict[str, list[PatternMatch]] | None:
+    """Detect PII in an image, see detect_pii_in_image. Returns None if detection fails."""
     try:
-        # Load image
-        image = image_to_pil_image(image_data)
+        cache_key, detections, image = _lookup_image(image_data)
+        if detections is None and image is not None:
+            detections = _analyze_image(_prepare_image_for_ocr(image))
+            _cache_image_detections(cache_key, detections)
+        return _filter_detections(detections or {}, enabled_types)
 
-        # Use Presidio Image Redactor with our configured analyzer
-        # This performs OCR and PII detection in one step
-        image_analyzer = get_image_analyzer()
+    except Exception as e:
+        logger.error(f"Error detecting PII in image: {e}", exc_info=True)
+        return None
 
-        analyzer_results = image_analyzer.analyze(
-            image=image,
-            language="en",
-        )
 
-        # Convert Presidio results to our PatternMatch format
-        results: dict[str, list[PatternMatch]] = {}
+# Images OCR'd per docTR call, bounding how many decoded images are held at once
+OCR_BATCH_SIZE = 16
 
-        # Process Presidio results (standard PII types + custom secrets via PatternRecognizers)
-        if analyzer_results:
-            for entity in analyzer_results:
-                # Map Presidio entity type to our PII type
-                # This includes both standard Presidio types and our custom secret types
-                pii_type = PRESIDIO_TO_PII_TYPE.get(entity.entity_type, entity.entity_type.lower())
 
-                # Filter by enabled types if specified
-                if enabled_types and pii_type not in enabled_types:
-                    continue
+def detect_pii_in_images(
+    images: Sequence[bytes | str | Path | Image.Image],
+    enabled_types: set[str] | None = None,
+) -> list[dict[str, list[PatternMatch]]]:
+    """
+    Detect PII in several images, OCR'ing them in batches.
 
-                # Note: entity.start and entity.end are positions in the OCR-extracted text,
-                # not image coordinates. For image redaction, Presidio Image Redactor
-                # handles the coordinate mapping internally.
-                # We use a placeholder text since we don't have the actual OCR text here
-                match_text = f"[{pii_type}_detected_in_image]"
+    Cached images are answered from the cache; the others are OCR'd together in batches
+    of up to OCR_BATCH_SIZE with a single docTR model call per batch, which amortizes
+    per-call overhead and keeps a GPU busy, instead of one OCR call per image.
 
-                if pii_type not in results:
-                    results[pii_type] = []
-                results[pii_type].append((match_text, entity.start, entity.end))
+    Args:
+        images: Images as bytes, file paths (str), Path objects, or PIL Images
+        enabled_types: Optional set of PII types to detect. If None, detects all types.
 
-        return results
+    Returns:
+        List of detections dictionaries, one per image and in the same order. Images
+        whose detection failed get an empty dict.
+    """
+    return [
+        {} if detections is None else detections
+        for detections in try_detect_pii_in_images(images, enabled_types=enabled_types)
+    ]
 
-    except Exception as e:
-        logger.error(f"Error detecting PII in image: {e}", exc_info=True)
-        return {}
+
+def try_detect_pii_in_images(
+    images: Sequence[bytes | str | Path | Image.Image],
+    enabled_types: set[str] | None = None,
+) -> list[dict[str, list[PatternMatch]] | None]:
+    """
+    Detect PII in several images, marking the images whose detection failed.
+
+    Same as detect_pii_in_images, except that an image whose detection failed, e.g.
+    because OCR raised, gets None instead of an empty dict, so callers can tell it apart
+    from an image without PII and treat it as possibly containing PII.
+
+    Args:
+        images: Images as bytes, file paths (str), Path objects, or PIL Images
+        enabled_types: Optional set of PII types to detect. If None, detects all types.
+
+    Returns:
+        List of detections dictionaries, or None for images whose detection failed, one
+        per image and in the same order.
+    """
+    if not images:
+        return []
+    if not image_detection_enabled():
+        return [{} for _ in images]
+    if len(images) == 1:
+        return [_try_detect_pii_in_image(images[0], enabled_types)]
+
+    results: list[dict[str, list[PatternMatch]] | None] = [None for _ in images]
+    pending: list[tuple[int, bytes, Image.Image]] = []  # (index, cache key, prepared image)
+    for index, image_data in enumerate(images):
+        try:
+            cache_key, detections, image = _lookup_image(image_data)
+            if detections is not None:
+                results[index] = _filter_detections(detections, enabled_types)
+            elif image is not None:
+                pending.append((index, cache_key, _prepare_image_for_ocr(image)))
+        except Exception as e:
+            logger.error(f"Error detecting PII in image: {e}", exc_info=True)
+
+    for batch_start in range(0, len(pending), OCR_BATCH_SIZE):
+        batch = pending[batch_start : batch_start + OCR_BATCH_SIZE]
+        try:
+            all_detections = _analyze_images([image for _, _, image in batch])
+        except Exception as e:
+            # The batch's images keep their None marker and aren't cached, so they are
+            # detected again the next time they are sent
+            logger.error(f"Error detecting PII in images: {e}", exc_info=True)
+            continue
+        for (index, cache_key, _image), detections in zip(batch, all_detections, strict=True):
+            _cache_image_detections(cache_key, detections)
+            results[index] = _filter_detections(detections, enabled_types)
+
+    return results
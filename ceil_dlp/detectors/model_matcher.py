@@ -1,10 +1,15 @@
 """Model matching utility for model-aware policies."""
 
+import contextlib
 import logging
 import re
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
+# Patterns containing any of these characters are treated as regexes
+_REGEX_CHARS_RE = re.compile(r"[*?.^$\[\](){}|+]")
+
 
 def matches_model(model: str, pattern: str) -> bool:
     """
@@ -18,9 +23,7 @@ def matches_model(model: str, pattern: str) -> bool:
         True if model matches pattern
     """
     # Check if pattern contains regex special characters
-    regex_chars = r"[*?.^$\[\](){}|+]"
-
-    if not re.search(regex_chars, pattern):
+    if not _REGEX_CHARS_RE.search(pattern):
         return model == pattern
 
     try:
@@ -28,3 +31,51 @@ def matches_model(model: str, pattern: str) -> bool:
     except re.error as e:
         logger.debug("invalid regular expression pattern: %s: %s", pattern, e)
         return False
+
+
+class ModelPatterns:
+    """A list of model patterns compiled once, matched with the same rules as matches_model.
+
+    Exact-name patterns become a set lookup and all regex patterns are combined into a
+    single alternation when possible, so checking a model costs one hash lookup and at
+    most one regex match instead of one matches_model call per pattern.
+    """
+
+    def __init__(self, patterns: tuple[str, ...]) -> None:
+        exact: set[str] = set()
+        compiled: list[re.Pattern[str]] = []
+        for pattern in patterns:
+            if not _REGEX_CHARS_RE.search(pattern):
+                exact.add(pattern)
+                continue
+            try:
+                compiled.append(re.compile(pattern))
+            except re.error as e:
+                logger.debug("invalid regular expression pattern: %s: %s", pattern, e)
+
+        self._exact = frozenset(exact)
+        self._regexes = compiled
+        # Group numbers and global inline flags don't survive being combined, so those
+        # pattern lists keep one compiled regex per pattern
+        if len(compiled) > 1 and all(regex.groups == 0 for regex in compiled):
+            with contextlib.suppress(re.error):
+                self._regexes = [re.compile("|".join(f"(?:{r.pattern})" for r in compiled))]
+
+    def matches(self, model: str) -> bool:
+        """Check if the model name matches any of the patterns."""
+        if model in self._exact:
+            return True
+        return any(regex.match(model) for regex in self._regexes)
+
+
+@lru_cache(maxsize=256)
+def compile_model_patterns(patterns: tuple[str, ...]) -> ModelPatterns:
+    """Get the cached compiled form of a list of model patterns.
+
+    Args:
+        patterns: Patterns to match (exact strings or regexes)
+
+    Returns:
+        ModelPatterns matching a model name against all of the patterns
+    """
+    return ModelPatterns(patterns)
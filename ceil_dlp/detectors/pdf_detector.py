@@ -2,16 +2,23 @@
 
 import io
 import logging
+import threading
 from pathlib import Path
 
 import pypdfium2 as pdfium
+from PIL import Image
 
-from ceil_dlp.detectors.image_detector import detect_pii_in_image
+from ceil_dlp.detectors.image_detector import OCR_BATCH_SIZE, try_detect_pii_in_images
 from ceil_dlp.detectors.patterns import PatternMatch
-from ceil_dlp.detectors.text_detector import detect_pii_in_text
+from ceil_dlp.detectors.text_detector import detect_pii_in_text_batch
 
 logger = logging.getLogger(__name__)
 
+# pdfium is not thread-safe and requests are processed on worker threads, so every
+# pypdfium2 call is made while holding this lock, including closing documents and bitmaps.
+# Text and image PII detection on the extracted text and rendered pages runs outside it
+PDFIUM_LOCK = threading.RLock()
+
 
 def detect_pii_in_pdf(
     pdf_data: bytes | str | Path, enabled_types: set[str] | None = None
@@ -19,6 +26,52 @@ def detect_pii_in_pdf(
     """
     Detect PII in a PDF by extracting text and images, then running detection on both.
 
+    Merges the per-page detections of detect_pii_in_pdf_pages.
+
+    Args:
+        pdf_data: PDF as bytes, file path (str), or Path object
+        enabled_types: Optional set of PII types to detect. If None, detects all types.
+
+    Returns:
+        Dictionary mapping PII type to list of matches (same format as text detection).
+        Returns empty dict if PDF processing fails.
+    """
+    return try_detect_pii_in_pdf(pdf_data, enabled_types=enabled_types)[0]
+
+
+def try_detect_pii_in_pdf(
+    pdf_data: bytes | str | Path, enabled_types: set[str] | None = None
+) -> tuple[dict[str, list[PatternMatch]], bool]:
+    """
+    Detect PII in a PDF, also reporting whether all of it could be scanned.
+
+    Same as detect_pii_in_pdf, for callers that must not treat a PDF whose detection
+    failed, in part or entirely, as free of PII, e.g. to avoid caching the result.
+
+    Args:
+        pdf_data: PDF as bytes, file path (str), or Path object
+        enabled_types: Optional set of PII types to detect. If None, detects all types.
+
+    Returns:
+        Tuple of (detections, complete) where detections is as returned by
+        detect_pii_in_pdf and complete is False if the PDF couldn't be processed or the
+        text or image of any page couldn't be scanned.
+    """
+    pages, complete = _detect_pii_in_pdf_pages(pdf_data, enabled_types)
+    results: dict[str, list[PatternMatch]] = {}
+    for page_results in pages.values():
+        for pii_type, matches in page_results.items():
+            # Position tracking is approximate since we're combining pages
+            results.setdefault(pii_type, []).extend(matches)
+    return results, complete
+
+
+def detect_pii_in_pdf_pages(
+    pdf_data: bytes | str | Path, enabled_types: set[str] | None = None
+) -> dict[int, dict[str, list[PatternMatch]]]:
+    """
+    Detect PII in each page of a PDF, in both its extracted text and its rendered image.
+
     Uses pypdfium2 to:
     1. Extract text from PDF pages (for text-based PDFs)
     2. Render pages to images for OCR-based detection (for scanned PDFs and image-based content)
@@ -29,69 +82,130 @@ def detect_pii_in_pdf(
         enabled_types: Optional set of PII types to detect. If None, detects all types.
 
     Returns:
-        Dictionary mapping PII type to list of matches (same format as text detection).
+        Dictionary mapping page number (0-based) to that page's detections, which map PII
+        type to list of matches (same format as text detection). Pages without detections
+        are left out, except pages whose text or image could not be scanned, which are
+        kept with the detections found so far so callers treat them as possibly
+        containing PII.
         Returns empty dict if PDF processing fails.
     """
+    return _detect_pii_in_pdf_pages(pdf_data, enabled_types)[0]
+
+
+def _detect_pii_in_pdf_pages(
+    pdf_data: bytes | str | Path, enabled_types: set[str] | None
+) -> tuple[dict[int, dict[str, list[PatternMatch]]], bool]:
+    """Detect PII in each page of a PDF, see detect_pii_in_pdf_pages.
+
+    Returns:
+        Tuple of (page detections, complete) where complete is False if the PDF couldn't
+        be processed or the text or image of any page couldn't be scanned.
+    """
+    if not isinstance(pdf_data, (bytes, str, Path)):
+        logger.error(f"Invalid pdf_data type: {type(pdf_data)}")
+        return {}, False
     try:
-        # Load PDF
-        if isinstance(pdf_data, (str, Path)):
-            pdf = pdfium.PdfDocument(pdf_data)
-        elif isinstance(pdf_data, bytes):
-            pdf = pdfium.PdfDocument(io.BytesIO(pdf_data))
-        else:
-            logger.error(f"Invalid pdf_data type: {type(pdf_data)}")
-            return {}
-
-        results: dict[str, list[PatternMatch]] = {}
-
-        # Process each page
-        for page_num in range(len(pdf)):
-            try:
-                page = pdf[page_num]
+        with PDFIUM_LOCK:
+            # Load PDF
+            if isinstance(pdf_data, bytes):
+                pdf = pdfium.PdfDocument(io.BytesIO(pdf_data))
+            else:
+                pdf = pdfium.PdfDocument(pdf_data)
+        try:
+            return _detect_pii_in_open_pdf(pdf, enabled_types)
+        finally:
+            # Also closes the pages and text pages that are still open
+            with PDFIUM_LOCK:
+                pdf.close()
 
-                # First, extract text from page
-                textpage = page.get_textpage()
+    except Exception as e:
+        logger.error(f"Error detecting PII in PDF: {e}", exc_info=True)
+        return {}, False
+
+
+def _detect_pii_in_open_pdf(
+    pdf: pdfium.PdfDocument, enabled_types: set[str] | None
+) -> tuple[dict[int, dict[str, list[PatternMatch]]], bool]:
+    """Detect PII in each page of an open PDF, see _detect_pii_in_pdf_pages."""
+    results: dict[int, dict[str, list[PatternMatch]]] = {}
+
+    # First, extract text from all pages so it can be scanned in a single batch
+    page_texts: dict[int, str] = {}
+    with PDFIUM_LOCK:
+        page_count = len(pdf)
+        for page_num in range(page_count):
+            try:
+                textpage = pdf[page_num].get_textpage()
                 page_text = textpage.get_text_bounded()
+                textpage.close()
                 if page_text and page_text.strip():
-                    # Detect PII in extracted text
-                    text_detections = detect_pii_in_text(page_text, enabled_types=enabled_types)
-                    # Merge results (use page offset to track positions if needed)
-                    for pii_type, matches in text_detections.items():
-                        if pii_type not in results:
-                            results[pii_type] = []
-                        # For PDFs, we track that these came from text extraction
-                        # Position tracking is approximate since we're combining pages
-                        results[pii_type].extend(matches)
-
-                # Second, render page to image for OCR-based detection (handles scanned PDFs)
+                    page_texts[page_num] = page_text
+            except Exception as text_error:
+                logger.warning(f"Error extracting text from PDF page {page_num}: {text_error}")
+
+    text_detections_by_page: dict[int, dict[str, list[PatternMatch]]] = {}
+    unscanned_pages: set[int] = set()
+    if page_texts:
+        try:
+            text_detections_batch = detect_pii_in_text_batch(
+                list(page_texts.values()), enabled_types=enabled_types
+            )
+            text_detections_by_page = dict(zip(page_texts, text_detections_batch, strict=True))
+        except Exception as text_error:
+            # Fail closed: pages whose text couldn't be scanned may contain PII
+            logger.warning(f"Error detecting PII in PDF text: {text_error}")
+            unscanned_pages.update(page_texts)
+
+    # Second, render pages to images for OCR-based detection (handles scanned PDFs).
+    # Pages are OCR'd in batches rather than one at a time, and rendered one batch at a
+    # time so long documents don't hold every page image in memory
+    image_detections_by_page: dict[int, dict[str, list[PatternMatch]]] = {}
+    for batch_start in range(0, page_count, OCR_BATCH_SIZE):
+        page_images: dict[int, Image.Image] = {}
+        with PDFIUM_LOCK:
+            for page_num in range(batch_start, min(batch_start + OCR_BATCH_SIZE, page_count)):
                 try:
-                    # Render page at reasonable DPI for OCR
-                    bitmap = page.render(scale=2)  # 2x scale = ~144 DPI
-                    pil_image = bitmap.to_pil()
-
-                    # Detect PII in rendered page image
-                    image_detections = detect_pii_in_image(pil_image, enabled_types=enabled_types)
-                    # Merge image detection results with text detection results
-                    for pii_type, matches in image_detections.items():
-                        if pii_type not in results:
-                            results[pii_type] = []
-                        # Mark as detected in PDF image
-                        pdf_image_matches = [
-                            (f"[{pii_type}_detected_in_pdf_page_{page_num}]", start, end)
-                            for _text, start, end in matches
-                        ]
-                        results[pii_type].extend(pdf_image_matches)
-
+                    # Render page at reasonable DPI for OCR, in RGB byte order so PIL needn't
+                    # swap channels from pdfium's default BGR. PIL copies RGB pixels, so the
+                    # bitmap can be closed right away
+                    bitmap = pdf[page_num].render(scale=2, rev_byteorder=True)  # 2x = ~144 DPI
+                    page_images[page_num] = bitmap.to_pil()
+                    bitmap.close()
                 except Exception as render_error:
                     logger.debug(f"Could not render page {page_num} to image: {render_error}")
-
-            except Exception as page_error:
-                logger.warning(f"Error processing PDF page {page_num}: {page_error}")
-                continue
-
-        pdf.close()
-        return results
-
-    except Exception as e:
-        logger.error(f"Error detecting PII in PDF: {e}", exc_info=True)
-        return {}
+                    unscanned_pages.add(page_num)
+        if page_images:
+            image_detections_batch = try_detect_pii_in_images(
+                list(page_images.values()), enabled_types=enabled_types
+            )
+            for page_num, image_detections in zip(page_images, image_detections_batch, strict=True):
+                if image_detections is None:
+                    # Fail closed: pages whose image couldn't be scanned may contain PII
+                    unscanned_pages.add(page_num)
+                else:
+                    image_detections_by_page[page_num] = image_detections
+
+    # Process each page
+    for page_num in range(page_count):
+        page_results: dict[str, list[PatternMatch]] = {}
+
+        # Merge PII detected in the page's extracted text
+        text_detections = text_detections_by_page.get(page_num, {})
+        for pii_type, matches in text_detections.items():
+            # For PDFs, we track that these came from text extraction
+            page_results.setdefault(pii_type, []).extend(matches)
+
+        # Merge image detection results with text detection results
+        image_detections = image_detections_by_page.get(page_num, {})
+        for pii_type, matches in image_detections.items():
+            # Mark as detected in PDF image
+            pdf_image_matches = [
+                (f"[{pii_type}_detected_in_pdf_page_{page_num}]", start, end)
+                for _text, start, end in matches
+            ]
+            page_results.setdefault(pii_type, []).extend(pdf_image_matches)
+
+        if page_results or page_num in unscanned_pages:
+            results[page_num] = page_results
+
+    return results, not unscanned_pages
@@ -1,9 +1,14 @@
 """Adapter to integrate Presidio for standard PII detection."""
 
+import hashlib
 import logging
 import os
+import re
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
 from functools import lru_cache
-from typing import cast
+from typing import Any, cast
 
 # Set transformers verbosity BEFORE importing anything that might use transformers
 # This suppresses the "Some weights were not used" warning which is expected when loading
@@ -12,9 +17,17 @@ os.environ.setdefault("TRANSFORMERS_VERBOSITY", "error")
 # Disable advisory warnings (like the "Some weights were not used" message)
 os.environ.setdefault("TRANSFORMERS_NO_ADVISORY_WARNINGS", "1")
 
-from presidio_analyzer import AnalyzerEngine, Pattern, PatternRecognizer, RecognizerRegistry
+from presidio_analyzer import (
+    AnalyzerEngine,
+    EntityRecognizer,
+    Pattern,
+    PatternRecognizer,
+    RecognizerRegistry,
+    RecognizerResult,
+)
+from presidio_analyzer.nlp_engine import NlpEngine, NlpEngineProvider
 
-from ceil_dlp.detectors.patterns import PatternMatch, PatternType
+from ceil_dlp.detectors.patterns import PATTERNS, PatternMatch, PatternType
 
 logger = logging.getLogger(__name__)
 
@@ -96,20 +109,390 @@ def get_pii_type_to_entities() -> dict[str, list[str]]:
     return {v: [k] for k, v in PRESIDIO_TO_PII_TYPE.items()}
 
 
-def _create_secret_recognizers() -> list[PatternRecognizer]:
+# Flags whose values are identical in the stdlib re module and the regex module Presidio uses
+_UNION_REGEX_FLAGS = re.IGNORECASE | re.MULTILINE | re.DOTALL
+
+# A global inline flag group at the start of a pattern, e.g. "(?i)"
+_LEADING_INLINE_FLAGS_RE = re.compile(r"^\(\?([imsx]+)\)")
+
+
+def _union_regex(patterns: list[str]) -> str:
+    """Combine regex patterns into a single alternation.
+
+    Leading global inline flags such as "(?i)" are only valid at the very start of a
+    regex, so they are rewritten as scoped groups ("(?i:...)") for their alternative.
+    """
+    alternatives = []
+    for pattern in patterns:
+        flags_match = _LEADING_INLINE_FLAGS_RE.match(pattern)
+        if flags_match:
+            pattern = f"(?{flags_match.group(1)}:{pattern[flags_match.end() :]})"
+        alternatives.append(f"(?:{pattern})")
+    return "|".join(alternatives)
+
+
+def _compile_re2(source: str, flags: int) -> Any | None:
+    """Compile a regex with google-re2 if it is installed and supports the pattern.
+
+    RE2 matches in linear time with no backtracking, which makes the union prefilter
+    much faster on long inputs and immune to catastrophic backtracking. Install with:
+    pip install google-re2
+
+    Returns:
+        Compiled RE2 regex, or None if google-re2 is not installed or rejects the pattern
+        (e.g. repetition counts above 1000).
+    """
+    try:
+        import re2
+    except ImportError:
+        return None
+
+    options = re2.Options()
+    options.log_errors = False
+    options.never_capture = True
+    inline_flags = "".join(
+        letter
+        for flag, letter in ((re.IGNORECASE, "i"), (re.MULTILINE, "m"), (re.DOTALL, "s"))
+        if flags & flag
+    )
+    if inline_flags:
+        source = f"(?{inline_flags}){source}"
+    try:
+        return re2.compile(source, options)
+    except re2.error as e:
+        logger.debug(f"Falling back to re, RE2 rejected pattern: {e}")
+        return None
+
+
+def _ascii_engine_compatible(text: str) -> bool:
+    """Check whether RE2/Hyperscan and the re module agree on character classes for this text.
+
+    RE2's and Hyperscan's character classes and word boundaries are ASCII-only, and RE2's
+    whitespace class excludes vertical tab, so they are only used for ASCII text without
+    vertical tabs.
+    """
+    return text.isascii() and "\x0b" not in text
+
+
+# Flags Presidio's PatternRecognizer uses unless told otherwise
+_PRESIDIO_REGEX_FLAGS = re.DOTALL | re.MULTILINE | re.IGNORECASE
+
+
+class _SharedSecretPrefilter(ABC):
+    """Single multi-pattern pass reporting which secret entities have at least one match.
+
+    All secret patterns are compiled into one multi-pattern matcher, so one scan of a text
+    tells every secret recognizer whether it needs to run its per-pattern analysis.
+    AnalyzerEngine calls each recognizer in turn with the same text object, so the result
+    for the most recent text is kept per thread and reused by the remaining recognizers.
+    """
+
+    def __init__(self, entities: list[str]) -> None:
+        self._entities = entities  # pattern id -> entity name
+        self.covered_entities = frozenset(entities)
+        self._local = threading.local()
+
+    def matched_entities(self, text: str) -> frozenset[str]:
+        local = self._local
+        if getattr(local, "text", None) is text:
+            return cast(frozenset[str], local.entities)
+
+        entities = frozenset(self._entities[pattern_id] for pattern_id in self._scan(text))
+        local.text = text
+        local.entities = entities
+        return entities
+
+    @abstractmethod
+    def _scan(self, text: str) -> set[int]:
+        """Return the ids of the patterns matching somewhere in the (ASCII) text."""
+
+
+class _HyperscanSecretPrefilter(_SharedSecretPrefilter):
+    """Shared secret prefilter backed by a Hyperscan multi-pattern database."""
+
+    def __init__(self, hyperscan: Any, database: Any, entities: list[str]) -> None:
+        super().__init__(entities)
+        self._hyperscan = hyperscan
+        self._database = database
+
+    def _scan(self, text: str) -> set[int]:
+        # Scratch space can't be shared between concurrent scans, so each thread has its own
+        local = self._local
+        scratch = getattr(local, "scratch", None)
+        if scratch is None:
+            scratch = local.scratch = self._hyperscan.Scratch(self._database)
+
+        matched_ids: set[int] = set()
+
+        def on_match(pattern_id: int, _start: int, _end: int, _flags: int, _context: Any) -> None:
+            matched_ids.add(pattern_id)
+
+        self._database.scan(text.encode("ascii"), match_event_handler=on_match, scratch=scratch)
+        return matched_ids
+
+
+class _RE2SetSecretPrefilter(_SharedSecretPrefilter):
+    """Shared secret prefilter backed by a google-re2 Set (one linear-time DFA pass)."""
+
+    def __init__(self, regex_set: Any, entities: list[str]) -> None:
+        super().__init__(entities)
+        self._regex_set = regex_set
+
+    def _scan(self, text: str) -> set[int]:
+        # Match returns None rather than an empty list when no pattern matches
+        return set(self._regex_set.Match(text) or ())
+
+
+def _create_hyperscan_prefilter(
+    patterns_by_entity: dict[str, list[str]],
+) -> _HyperscanSecretPrefilter | None:
+    """Compile all secret patterns into one Hyperscan database if hyperscan is installed.
+
+    Install with: pip install hyperscan
+
+    Returns:
+        Prefilter for Presidio's default regex flags, or None if hyperscan is not installed
+        or rejects a pattern.
+    """
+    try:
+        import hyperscan
+    except ImportError:
+        return None
+
+    entities = list(patterns_by_entity)
+    expressions: list[bytes] = []
+    ids: list[int] = []
+    for entity_id, entity in enumerate(entities):
+        for pattern in patterns_by_entity[entity]:
+            expressions.append(pattern.encode())
+            ids.append(entity_id)
+
+    # Match Presidio's default flags; SINGLEMATCH reports each pattern at most once
+    flags = (
+        hyperscan.HS_FLAG_CASELESS
+        | hyperscan.HS_FLAG_DOTALL
+        | hyperscan.HS_FLAG_MULTILINE
+        | hyperscan.HS_FLAG_SINGLEMATCH
+    )
+    database = hyperscan.Database()
+    try:
+        database.compile(
+            expressions=expressions,
+            ids=ids,
+            elements=len(expressions),
+            flags=[flags] * len(expressions),
+        )
+    except hyperscan.error as e:
+        logger.debug(f"Falling back to per-recognizer secret prefilter, Hyperscan error: {e}")
+        return None
+    return _HyperscanSecretPrefilter(hyperscan, database, entities)
+
+
+def _create_re2_set_prefilter(
+    patterns_by_entity: dict[str, list[str]],
+) -> _RE2SetSecretPrefilter | None:
+    """Compile secret patterns into one google-re2 Set if google-re2 is installed.
+
+    RE2 rejects some patterns (e.g. repetition counts above 1000). Entities with such a
+    pattern are left out of the set and keep their per-recognizer prefilter.
+
+    Returns:
+        Prefilter for Presidio's default regex flags, or None if google-re2 is not installed
+        or no entity could be compiled.
+    """
+    try:
+        import re2
+    except ImportError:
+        return None
+
+    options = re2.Options()
+    options.log_errors = False
+    options.never_capture = True
+
+    entities: list[str] = []
+    expressions: list[str] = []
+    for entity, patterns in patterns_by_entity.items():
+        # Presidio's default flags, as inline flags
+        entity_expressions = [f"(?ims){pattern}" for pattern in patterns]
+        try:
+            for expression in entity_expressions:
+                # Added to a throwaway set first, so one bad pattern doesn't leave a partial entity
+                re2.Set.SearchSet(options).Add(expression)
+        except re2.error as e:
+            logger.debug(f"Leaving {entity} out of the RE2 secret prefilter, RE2 error: {e}")
+            continue
+        entities.extend([entity] * len(entity_expressions))
+        expressions.extend(entity_expressions)
+
+    if not expressions:
+        return None
+
+    regex_set = re2.Set.SearchSet(options)
+    for expression in expressions:
+        regex_set.Add(expression)
+    regex_set.Compile()
+    return _RE2SetSecretPrefilter(regex_set, entities)
+
+
+class _PrefilteredPatternRecognizer(PatternRecognizer):
+    """PatternRecognizer that skips its per-pattern scans when none of its patterns match.
+
+    Presidio runs a separate finditer pass over the text for every pattern. Most texts
+    contain no secrets, so a single search with the union of all patterns decides whether
+    those passes are needed at all. When the union matches, the regular per-pattern
+    analysis runs, so results are identical to a plain PatternRecognizer.
+    """
+
+    # Presidio assigns these in __init__ without annotations
+    name: str
+    patterns: list[Pattern]
+
+    def __init__(
+        self,
+        supported_entity: str,
+        patterns: list[Pattern],
+        shared_prefilter: _SharedSecretPrefilter | None = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(supported_entity=supported_entity, patterns=patterns, **kwargs)
+        self._shared_prefilter = shared_prefilter
+        # RE2 versions of the patterns, for the flags they were compiled with. None when
+        # RE2 rejects any of the patterns, which then all run through Presidio
+        self._patterns_re2: list[Any] | None = None
+        self._patterns_re2_flags: int | None = None
+        self._union_source = _union_regex([pattern.regex for pattern in patterns])
+        self._union_compiled: re.Pattern[str] | None = None
+        self._union_re2: Any | None = None
+        self._union_compiled_flags: int | None = None
+
+    def analyze(
+        self,
+        text: str,
+        entities: list[str],
+        nlp_artifacts: Any = None,
+        regex_flags: int | None = None,
+    ) -> list[RecognizerResult]:
+        flags = regex_flags if regex_flags else self.global_regex_flags
+        if (
+            self._shared_prefilter is not None
+            and self.supported_entities[0] in self._shared_prefilter.covered_entities
+            and flags == _PRESIDIO_REGEX_FLAGS
+            and _ascii_engine_compatible(text)
+        ):
+            if self.supported_entities[0] not in self._shared_prefilter.matched_entities(text):
+                return []
+            return self._analyze_patterns(text, entities, nlp_artifacts, regex_flags)
+
+        # Only gate when the flags mean the same thing to the stdlib re module
+        if self._union_source and flags is not None and not flags & ~_UNION_REGEX_FLAGS:
+            if self._union_compiled is None or self._union_compiled_flags != flags:
+                self._union_compiled = re.compile(self._union_source, flags)
+                self._union_re2 = _compile_re2(self._union_source, flags)
+                self._union_compiled_flags = flags
+            if self._union_re2 is not None and _ascii_engine_compatible(text):
+                union_match = self._union_re2.search(text)
+            else:
+                union_match = self._union_compiled.search(text)
+            if union_match is None:
+                return []
+        return self._analyze_patterns(text, entities, nlp_artifacts, regex_flags)
+
+    def _analyze_patterns(
+        self,
+        text: str,
+        entities: list[str],
+        nlp_artifacts: Any = None,
+        regex_flags: int | None = None,
+    ) -> list[RecognizerResult]:
+        """Run the per-pattern analysis, with RE2 when it matches like Presidio's regex.
+
+        Presidio matches each pattern with the backtracking regex module. RE2 finds the
+        same (leftmost-first) matches in linear time wherever the two engines agree on
+        character classes, so ASCII text is matched with RE2 when google-re2 accepts all
+        of the patterns. Results are built and scored the way PatternRecognizer does.
+
+        This mirrors the loop of PatternRecognizer's private __analyze_patterns, which
+        is why presidio-analyzer is capped in pyproject.toml. The equivalence tests with
+        google-re2 installed catch drift when the cap is raised.
+        """
+        flags = regex_flags if regex_flags else self.global_regex_flags
+        if flags is None or flags & ~_UNION_REGEX_FLAGS or not _ascii_engine_compatible(text):
+            return super().analyze(text, entities, nlp_artifacts, regex_flags)
+        if self._patterns_re2_flags != flags:
+            compiled = [_compile_re2(pattern.regex, flags) for pattern in self.patterns]
+            self._patterns_re2 = None if None in compiled else compiled
+            self._patterns_re2_flags = flags
+        if self._patterns_re2 is None:
+            return super().analyze(text, entities, nlp_artifacts, regex_flags)
+
+        results: list[RecognizerResult] = []
+        for pattern, pattern_re2 in zip(self.patterns, self._patterns_re2, strict=True):
+            for match in pattern_re2.finditer(text):
+                start, end = match.span()
+                current_match = text[start:end]
+                if current_match == "":
+                    continue
+
+                validation_result = self.validate_result(current_match)
+                description = self.build_regex_explanation(
+                    self.name,
+                    pattern.name,
+                    pattern.regex,
+                    pattern.score,
+                    # Presidio passes the Optional result through despite its annotation
+                    cast(bool, validation_result),
+                    flags,
+                )
+                result = RecognizerResult(
+                    entity_type=self.supported_entities[0],
+                    start=start,
+                    end=end,
+                    score=pattern.score,
+                    analysis_explanation=description,
+                    recognition_metadata={
+                        RecognizerResult.RECOGNIZER_NAME_KEY: self.name,
+                        RecognizerResult.RECOGNIZER_IDENTIFIER_KEY: self.id,
+                    },
+                )
+                if validation_result is not None:
+                    result.score = (
+                        EntityRecognizer.MAX_SCORE
+                        if validation_result
+                        else EntityRecognizer.MIN_SCORE
+                    )
+                if self.invalidate_result(current_match):
+                    result.score = EntityRecognizer.MIN_SCORE
+                if result.score > EntityRecognizer.MIN_SCORE:
+                    results.append(result)
+                description.score = result.score
+        return EntityRecognizer.remove_duplicates(results)
+
+
+def _create_secret_recognizers() -> list[_PrefilteredPatternRecognizer]:
     """
     Create Presidio PatternRecognizer objects for custom secrets (API keys, etc.).
 
     Returns:
         List of PatternRecognizer objects
     """
-    from ceil_dlp.detectors.patterns import PATTERNS
-
-    recognizers = []
+    recognizers: list[_PrefilteredPatternRecognizer] = []
 
     # Custom types that can be represented as regex patterns
     custom_types = {"api_key", "pem_key", "jwt_token", "database_url", "cloud_credential"}
 
+    # One Hyperscan (or else RE2 Set) scan decides which of the secret recognizers need to
+    # run, if either library is available
+    patterns_by_entity = {
+        pattern_type.upper(): patterns_list
+        for pattern_type, patterns_list in PATTERNS.items()
+        if pattern_type in custom_types
+    }
+    shared_prefilter: _SharedSecretPrefilter | None = _create_hyperscan_prefilter(
+        patterns_by_entity
+    )
+    if shared_prefilter is None:
+        shared_prefilter = _create_re2_set_prefilter(patterns_by_entity)
+
     for pattern_type in custom_types:
         if pattern_type not in PATTERNS:
             continue
@@ -128,9 +511,10 @@ def _create_secret_recognizers() -> list[PatternRecognizer]:
 
         if presidio_patterns:
             # Create PatternRecognizer for this secret type
-            recognizer = PatternRecognizer(
+            recognizer = _PrefilteredPatternRecognizer(
                 supported_entity=pattern_type.upper(),  # e.g., "API_KEY"
                 patterns=presidio_patterns,
+                shared_prefilter=shared_prefilter,
                 supported_language="en",
             )
             recognizers.append(recognizer)
@@ -138,6 +522,48 @@ def _create_secret_recognizers() -> list[PatternRecognizer]:
     return recognizers
 
 
+# spaCy model behind the default NLP engine (ner_strength 1, and tokenization for 3).
+# Override with CEIL_DLP_SPACY_MODEL, e.g. en_core_web_sm is several times faster and
+# much smaller than en_core_web_lg at some cost in person/location recall.
+SPACY_MODEL_DEFAULT = "en_core_web_lg"
+
+
+def _create_spacy_nlp_engine() -> NlpEngine:
+    """Create the spaCy NLP engine, using the model selected by CEIL_DLP_SPACY_MODEL.
+
+    Starts from Presidio's default spaCy configuration (the same one AnalyzerEngine uses
+    when no engine is given) so the entity mapping and ignored labels stay the same, and
+    only swaps the model.
+
+    Returns:
+        NlpEngine using the configured spaCy model (en_core_web_lg by default).
+    """
+    provider = NlpEngineProvider()
+    model_name = os.getenv("CEIL_DLP_SPACY_MODEL", SPACY_MODEL_DEFAULT)
+    if model_name != SPACY_MODEL_DEFAULT:
+        logger.info(f"Using spaCy model {model_name} for NER")
+        provider.nlp_configuration["models"][0]["model_name"] = model_name
+    return provider.create_engine()
+
+
+_analyzer_lock = threading.Lock()
+
+
+def _reset_analyzer_lock_after_fork() -> None:
+    """Give a forked worker a fresh analyzer lock.
+
+    If the parent forks while a background warmup thread holds the lock, the child would
+    inherit it locked with no thread left to release it. Analyzers already built in the
+    parent are kept, so workers share their memory copy-on-write; call warmup() in the
+    worker to load any that are still missing.
+    """
+    global _analyzer_lock
+    _analyzer_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_analyzer_lock_after_fork)
+
+
 @lru_cache(maxsize=3)  # Cache up to 3 analyzers (one per strength level: 1, 2, or 3)
 def _get_analyzer_cached(ner_strength: int) -> AnalyzerEngine:
     """Internal cached function - ner_strength must be 1, 2, or 3."""
@@ -152,8 +578,8 @@ def _get_analyzer_cached(ner_strength: int) -> AnalyzerEngine:
 
     # Configure NLP engine based on strength
     if ner_strength == 1:
-        # Use default (en_core_web_lg) - no special configuration needed
-        return AnalyzerEngine(registry=registry)
+        # Use default (en_core_web_lg) unless another spaCy model is configured
+        return AnalyzerEngine(registry=registry, nlp_engine=_create_spacy_nlp_engine())
     elif ner_strength == 3:
         try:
             from huggingface_hub.utils.tqdm import disable_progress_bars
@@ -202,7 +628,7 @@ def _get_analyzer_cached(ner_strength: int) -> AnalyzerEngine:
             registry.add_recognizer(gliner_recognizer)
 
             # Use default spaCy NLP engine (for tokenization, etc.)
-            return AnalyzerEngine(registry=registry)
+            return AnalyzerEngine(registry=registry, nlp_engine=_create_spacy_nlp_engine())
         except ImportError as e:
             logger.warning(
                 f"Failed to load GLiNER (ner_strength=3): Missing dependency. "
@@ -303,25 +729,189 @@ def get_analyzer(ner_strength: int = 1) -> AnalyzerEngine:
             f"ner_strength must be 1, 2, or 3, got {ner_strength}. "
             "Use 1 for en_core_web_lg, 2 for transformer-based NER, or 3 for GLiNER."
         )
-    return _get_analyzer_cached(ner_strength)
+    # Serialize construction so a background warmup and a request don't both load the model
+    with _analyzer_lock:
+        return _get_analyzer_cached(ner_strength)
 
 
-def _detect_with_presidio(text: str, ner_strength: int = 1) -> dict[str, list[PatternMatch]]:
-    analyzer = get_analyzer(ner_strength=ner_strength)
-    results = analyzer.analyze(text=text, language="en")
+def _results_to_detections(
+    text: str, results: list[RecognizerResult]
+) -> dict[str, list[PatternMatch]]:
+    """Convert Presidio analyzer results for a text into our detections format."""
     detections: dict[str, list[PatternMatch]] = {}
     for result in results:
-        entity_type = result.entity_type
-        pii_type = PRESIDIO_TO_PII_TYPE.get(entity_type)
+        pii_type = PRESIDIO_TO_PII_TYPE.get(result.entity_type)
         if pii_type:
-            matched_text = text[result.start : result.end]
-            match = (matched_text, result.start, result.end)
-            if pii_type not in detections:
-                detections[pii_type] = []
-            detections[pii_type].append(match)
+            match = (text[result.start : result.end], result.start, result.end)
+            detections.setdefault(pii_type, []).append(match)
     return detections
 
 
+# Characters that every supported entity needs at least one of: digits (cards, SSNs, phones,
+# IDs, dates), '@' (emails), URL/key punctuation, or a dotted domain. Text without any of
+# these that is also entirely lowercase (no capitalized names or places) cannot produce a
+# detection worth the cost of running the NLP pipeline.
+_PII_ANCHOR_RE = re.compile(r"[\d@:/=_\-]|\.\w")
+
+# For ASCII text the single-character anchors are found with bytes.translate, which deletes
+# every other byte in one C pass and is many times faster than a regex character class
+_ANCHOR_BYTES = b"0123456789@:/=_-"
+_NON_ANCHOR_BYTES = bytes(b for b in range(256) if b not in _ANCHOR_BYTES)
+_DOTTED_WORD_RE = re.compile(r"\.\w")
+
+# Set CEIL_DLP_PREFILTER=0 to always run the full analyzer, e.g. if lowercase-only names
+# or relative dates ("tomorrow") must be caught by the NER models.
+_PREFILTER_ENABLED = os.getenv("CEIL_DLP_PREFILTER", "1") != "0"
+
+# Texts shorter than this with no anchors and no uppercase letters ("", "...", "👍") are
+# skipped even though they contain no lowercase letters either
+_PREFILTER_MIN_LENGTH = int(os.getenv("CEIL_DLP_PREFILTER_MIN_LENGTH", "8"))
+
+
+def may_contain_pii(text: str) -> bool:
+    """Cheap check for whether text could contain any PII Presidio would detect.
+
+    False means detection would find nothing in the text; True means it has to run to tell.
+    """
+    if not _PREFILTER_ENABLED:
+        return True
+    # islower() is False if any character is uppercase (or none are cased at all)
+    if not text.islower() and (
+        len(text) >= _PREFILTER_MIN_LENGTH or any(c.isupper() for c in text)
+    ):
+        return True
+    return _has_pii_anchor(text)
+
+
+def _has_pii_anchor(text: str) -> bool:
+    """Check whether text contains any character _PII_ANCHOR_RE would match."""
+    if text.isascii():
+        if text.encode("ascii").translate(None, _NON_ANCHOR_BYTES):
+            return True
+        return _DOTTED_WORD_RE.search(text) is not None
+    # Unicode digits also count as anchors, so non-ASCII text uses the full regex
+    return _PII_ANCHOR_RE.search(text) is not None
+
+
+# System prompts, few-shot examples and tool descriptions repeat across calls, so
+# single-text detections (CLI, detect_pii_in_text, redaction) are cached by a digest of
+# the text. The text itself, which is the sensitive data, is never kept as a cache key.
+# The batch path isn't cached here: the middleware caches its segments itself
+_DETECTION_CACHE_SIZE = 2048
+_detection_cache: OrderedDict[bytes, dict[str, list[PatternMatch]]] = OrderedDict()
+_detection_cache_lock = threading.Lock()
+
+
+def _reset_detection_cache_lock_after_fork() -> None:
+    """Give a forked worker a fresh cache lock, in case the parent forked while it was held."""
+    global _detection_cache_lock
+    _detection_cache_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_detection_cache_lock_after_fork)
+
+
+def _detect_with_presidio(text: str, ner_strength: int = 1) -> dict[str, list[PatternMatch]]:
+    if not may_contain_pii(text):
+        logger.debug(f"Skipping Presidio analysis, no PII anchors in text of length {len(text)}")
+        return {}
+    key = hashlib.blake2b(f"{ner_strength}|".encode() + text.encode(), digest_size=16).digest()
+    with _detection_cache_lock:
+        detections = _detection_cache.get(key)
+        if detections is not None:
+            _detection_cache.move_to_end(key)
+    if detections is None:
+        analyzer = get_analyzer(ner_strength=ner_strength)
+        detections = _results_to_detections(text, analyzer.analyze(text=text, language="en"))
+        with _detection_cache_lock:
+            _detection_cache[key] = detections
+            _detection_cache.move_to_end(key)
+            if len(_detection_cache) > _DETECTION_CACHE_SIZE:
+                _detection_cache.popitem(last=False)
+    # Callers get fresh lists so mutating results can't corrupt the cache
+    return {pii_type: list(matches) for pii_type, matches in detections.items()}
+
+
+def _detect_with_presidio_batch(
+    texts: list[str], ner_strength: int = 1
+) -> list[dict[str, list[PatternMatch]]]:
+    """Detect PII in several texts, running the NLP pipeline once over the whole batch.
+
+    The NLP engine (spaCy or transformers) is the dominant per-call cost, so the texts
+    are processed together with ``nlp_engine.process_batch`` and the precomputed
+    artifacts are handed to ``analyze`` so each text is not re-tokenized.
+    """
+    detections_batch: list[dict[str, list[PatternMatch]]] = [{} for _ in texts]
+    # Only texts that pass the prefilter go through the NLP pipeline
+    indices = [i for i, text in enumerate(texts) if may_contain_pii(text)]
+    if not indices:
+        return detections_batch
+    analyzer = get_analyzer(ner_strength=ner_strength)
+    nlp_artifacts_batch = analyzer.nlp_engine.process_batch(
+        [texts[i] for i in indices], language="en", batch_size=len(indices)
+    )
+    for i, (text, nlp_artifacts) in zip(indices, nlp_artifacts_batch, strict=True):
+        results = analyzer.analyze(text=text, language="en", nlp_artifacts=nlp_artifacts)
+        detections_batch[i] = _results_to_detections(text, results)
+    return detections_batch
+
+
+def _ensemble_strengths(ner_strength: int) -> list[int]:
+    """Get the NER strengths whose results are merged for a given ensemble strength."""
+    if ner_strength not in (1, 2, 3):
+        raise ValueError(
+            f"ner_strength must be 1, 2, or 3, got {ner_strength}. "
+            "Use 1 for en_core_web_lg, 2 for spaCy+transformer ensemble, "
+            "or 3 for spaCy+transformer+GLiNER ensemble."
+        )
+    return list(range(1, ner_strength + 1))
+
+
+def _merge_detections(
+    detections_list: list[dict[str, list[PatternMatch]]],
+    enabled_types: set[str] | frozenset[str] | None = None,
+) -> dict[str, list[PatternMatch]]:
+    """Merge detections from several NER models, keeping one match per span.
+
+    Args:
+        detections_list: Detections from each model, in order of precedence (later wins)
+        enabled_types: Optional set of PII types to filter results
+
+    Returns:
+        Merged dictionary mapping PII type to list of matches.
+    """
+    if len(detections_list) == 1:
+        detections = detections_list[0]
+        if enabled_types:
+            detections = {k: v for k, v in detections.items() if k in enabled_types}
+        return detections
+
+    # For overlapping matches, prefer the one with better coverage or keep both
+    merged_detections: dict[str, list[PatternMatch]] = {}
+
+    # Collect all matches
+    all_matches: dict[
+        tuple[int, int], tuple[str, PatternMatch]
+    ] = {}  # (start, end) -> (pii_type, match)
+
+    # Add detections from all models
+    for detections in detections_list:
+        for pii_type, matches in detections.items():
+            if enabled_types and pii_type not in enabled_types:
+                continue
+            for match in matches:
+                _text, start, end = match
+                key = (start, end)
+                # Add match (will overwrite if same span, which is fine - later models take precedence)
+                all_matches[key] = (pii_type, match)
+
+    # Convert back to detections format
+    for pii_type, match in all_matches.values():
+        merged_detections.setdefault(pii_type, []).append(match)
+
+    return merged_detections
+
+
 def detect_with_presidio_ensemble(
     text: str,
     ner_strength: int = 1,
@@ -347,15 +937,6 @@ def detect_with_presidio_ensemble(
         Dictionary mapping PII type to list of matches.
         Each match is a tuple: (matched_text, start_pos, end_pos)
     """
-    # Validate ner_strength
-    if ner_strength not in (1, 2, 3):
-        raise ValueError(
-            f"ner_strength must be 1, 2, or 3, got {ner_strength}. "
-            "Use 1 for en_core_web_lg, 2 for spaCy+transformer ensemble, "
-            "or 3 for spaCy+transformer+GLiNER ensemble."
-        )
-    ner_strength_val = ner_strength
-
     # NER Ensemble: If strength 2 or 3, detect with multiple models and merge
     # NOTE: We detect with all models on the ORIGINAL text, then merge.
     # This is better than sequential (detect -> redact -> detect -> redact) because:
@@ -365,51 +946,106 @@ def detect_with_presidio_ensemble(
     # 4. No risk of missing PII that one model would catch but another already redacted
     # Sequential approach works for images because OCR can still read surrounding text
     # after redaction, but for text, redaction replaces content making it undetectable.
-    if ner_strength_val == 2:
-        # Two-model ensemble: spaCy + transformer
-        detections_spacy = _detect_with_presidio(text, ner_strength=1)
-        detections_transformer = _detect_with_presidio(text, ner_strength=2)
-        detections_list = [detections_spacy, detections_transformer]
-    elif ner_strength_val == 3:
-        # Three-model ensemble: spaCy + transformer + GLiNER
-        detections_spacy = _detect_with_presidio(text, ner_strength=1)
-        detections_transformer = _detect_with_presidio(text, ner_strength=2)
-        detections_gliner = _detect_with_presidio(text, ner_strength=3)
-        detections_list = [detections_spacy, detections_transformer, detections_gliner]
-    else:
-        # Single model detection
-        detections = _detect_with_presidio(text, ner_strength=ner_strength_val)
-        if enabled_types:
-            detections = {k: v for k, v in detections.items() if k in enabled_types}
-        return detections
+    detections_list = [
+        _detect_with_presidio(text, ner_strength=strength)
+        for strength in _ensemble_strengths(ner_strength)
+    ]
+    return _merge_detections(detections_list, enabled_types=enabled_types)
 
-    # Merge detections from all models
-    # For overlapping matches, prefer the one with better coverage or keep both
-    merged_detections: dict[str, list[PatternMatch]] = {}
 
-    # Collect all matches
-    all_matches: dict[
-        tuple[int, int], tuple[str, PatternMatch]
-    ] = {}  # (start, end) -> (pii_type, match)
+def has_pii_with_presidio_ensemble(
+    text: str,
+    ner_strength: int = 1,
+    enabled_types: set[str] | frozenset[str] | None = None,
+) -> bool:
+    """
+    Check whether any model in the ensemble detects PII, stopping at the first hit.
 
-    # Add detections from all models
-    for detections in detections_list:
-        for pii_type, matches in detections.items():
-            if enabled_types and pii_type not in enabled_types:
-                continue
-            for match in matches:
-                _text, start, end = match
-                key = (start, end)
-                # Add match (will overwrite if same span, which is fine - later models take precedence)
-                all_matches[key] = (pii_type, match)
+    Unlike detect_with_presidio_ensemble, this neither merges results nor runs the
+    heavier models once a lighter one has found an enabled PII type.
 
-    # Convert back to detections format
-    for (_start, _end), (pii_type, match) in all_matches.items():
-        if pii_type not in merged_detections:
-            merged_detections[pii_type] = []
-        merged_detections[pii_type].append(match)
+    Args:
+        text: Input text to scan
+        ner_strength: NER model strength (1, 2, or 3), see detect_with_presidio_ensemble.
+        enabled_types: Optional set of PII types to consider. If None, considers all types.
 
-    return merged_detections
+    Returns:
+        True if any enabled PII type is detected.
+    """
+    for strength in _ensemble_strengths(ner_strength):
+        detections = _detect_with_presidio(text, ner_strength=strength)
+        if enabled_types is None:
+            if detections:
+                return True
+        elif not enabled_types.isdisjoint(detections):
+            return True
+    return False
+
+
+def detect_with_presidio_ensemble_batch(
+    texts: list[str],
+    ner_strength: int = 1,
+    enabled_types: set[str] | frozenset[str] | None = None,
+) -> list[dict[str, list[PatternMatch]]]:
+    """
+    Batched variant of detect_with_presidio_ensemble.
+
+    Each NER model in the ensemble processes all texts in a single NLP pipeline pass,
+    which amortizes model overhead when many texts (messages, PDF pages) are scanned.
+
+    Args:
+        texts: Input texts to scan
+        ner_strength: NER model strength (1, 2, or 3), see detect_with_presidio_ensemble.
+        enabled_types: Optional set of PII types to filter results. If None, returns all detected types.
+
+    Returns:
+        List of detections dictionaries, one per input text and in the same order.
+    """
+    strengths = _ensemble_strengths(ner_strength)
+    if not texts:
+        return []
+    batches = [_detect_with_presidio_batch(texts, ner_strength=strength) for strength in strengths]
+    return [
+        _merge_detections([batch[i] for batch in batches], enabled_types=enabled_types)
+        for i in range(len(texts))
+    ]
+
+
+@lru_cache(maxsize=1)
+def _get_secret_recognizers() -> list[_PrefilteredPatternRecognizer]:
+    """Get cached secret recognizers for detection without an AnalyzerEngine."""
+    return _create_secret_recognizers()
+
+
+def detect_with_secret_recognizers(
+    text: str, enabled_types: set[str] | frozenset[str] | None = None
+) -> dict[str, list[PatternMatch]]:
+    """
+    Detect only the custom secret types (API keys, PEM keys, etc.), without any NLP model.
+
+    The secret recognizers are regex PatternRecognizers without context words, so for
+    their types this gives the same results as the analyzer of any ner_strength, but
+    neither loads nor runs a spaCy, transformer, or GLiNER model.
+
+    Args:
+        text: Input text to scan
+        enabled_types: Optional set of PII types to filter results. If None, returns all
+                      detected secret types.
+
+    Returns:
+        Dictionary mapping PII type to list of matches.
+    """
+    if not may_contain_pii(text):
+        return {}
+    results: list[RecognizerResult] = []
+    for recognizer in _get_secret_recognizers():
+        if enabled_types and PRESIDIO_TO_PII_TYPE.get(recognizer.supported_entities[0]) not in (
+            enabled_types
+        ):
+            continue
+        results.extend(recognizer.analyze(text, recognizer.supported_entities))
+    # Same post-processing as AnalyzerEngine.analyze for context-free recognizers
+    return _results_to_detections(text, EntityRecognizer.remove_duplicates(results))
 
 
 def detect_with_presidio(text: str, ner_strength: int = 1) -> dict[str, list[PatternMatch]]:
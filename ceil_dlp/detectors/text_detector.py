@@ -4,10 +4,14 @@ from ceil_dlp.detectors.patterns import PatternMatch
 from ceil_dlp.detectors.presidio_adapter import (
     PRESIDIO_TO_PII_TYPE,
     detect_with_presidio_ensemble,
+    detect_with_presidio_ensemble_batch,
+    detect_with_secret_recognizers,
+    has_pii_with_presidio_ensemble,
+    may_contain_pii,
 )
 
 # All Presidio entity types supported by ceil-dlp
-PRESIDIO_TYPES = frozenset(set(PRESIDIO_TO_PII_TYPE.values()))
+PRESIDIO_TYPES = frozenset(PRESIDIO_TO_PII_TYPE.values())
 CUSTOM_TYPES = frozenset(
     {
         "api_key",
@@ -17,7 +21,15 @@ CUSTOM_TYPES = frozenset(
         "cloud_credential",
     }
 )
-ENABLED_TYPES_DEFAULT = PRESIDIO_TYPES.union(CUSTOM_TYPES)
+ENABLED_TYPES_DEFAULT = PRESIDIO_TYPES | CUSTOM_TYPES
+
+
+def _types_to_detect(enabled_types: set[str] | None) -> frozenset[str]:
+    """Get the supported PII types to detect for an optional enabled_types filter."""
+    if enabled_types is None:
+        return ENABLED_TYPES_DEFAULT
+    # ENABLED_TYPES_DEFAULT is already the union of all supported types
+    return ENABLED_TYPES_DEFAULT.intersection(enabled_types)
 
 
 def detect_pii_in_text(
@@ -45,16 +57,98 @@ def detect_pii_in_text(
     Returns:
         Dictionary mapping PII type to list of matches.
     """
-    # Determine which types to detect
-    types_to_detect = ENABLED_TYPES_DEFAULT if enabled_types is None else frozenset(enabled_types)
-
-    all_types = types_to_detect.intersection(PRESIDIO_TYPES.union(CUSTOM_TYPES))
+    all_types = _types_to_detect(enabled_types)
 
     if not all_types:
         return {}
 
+    if all_types <= CUSTOM_TYPES:
+        # Secrets are found by regex alone, so no NER model needs to load or run
+        return detect_with_secret_recognizers(text, enabled_types=all_types)
+
     # Use ensemble detection (handles merging when ner_strength=2)
     # detect_with_presidio_ensemble already filters by enabled_types, including custom types
-    return detect_with_presidio_ensemble(
-        text, ner_strength=ner_strength, enabled_types=set(all_types)
+    return detect_with_presidio_ensemble(text, ner_strength=ner_strength, enabled_types=all_types)
+
+
+def has_pii_in_text(
+    text: str,
+    enabled_types: set[str] | None = None,
+    ner_strength: int = 3,
+) -> bool:
+    """
+    Check whether text contains any PII, without building the full list of matches.
+
+    Stops at the first NER model in the ensemble that finds an enabled PII type, so
+    callers that only need a yes/no answer skip the heavier models and result merging.
+
+    Args:
+        text: Input text to scan
+        enabled_types: Optional set of PII types to detect. If None, detects all types.
+        ner_strength: NER model strength (1, 2, or 3), see detect_pii_in_text.
+
+    Returns:
+        True if any enabled PII type is detected in the text.
+    """
+    all_types = _types_to_detect(enabled_types)
+
+    if not all_types:
+        return False
+
+    if all_types <= CUSTOM_TYPES:
+        return bool(detect_with_secret_recognizers(text, enabled_types=all_types))
+
+    return has_pii_with_presidio_ensemble(text, ner_strength=ner_strength, enabled_types=all_types)
+
+
+def may_have_pii_in_text(text: str, enabled_types: set[str] | None = None) -> bool:
+    """
+    Cheap check for whether text could contain any PII, without running detection.
+
+    Looks for the characters PII is anchored on (digits, "@", URL and key punctuation,
+    capitalized words) rather than running any recognizer or NER model.
+
+    Args:
+        text: Input text to check
+        enabled_types: Optional set of PII types to detect. If None, detects all types.
+
+    Returns:
+        False if detect_pii_in_text would find nothing in the text, True if it has to run
+        to tell.
+    """
+    if not _types_to_detect(enabled_types):
+        return False
+
+    return may_contain_pii(text)
+
+
+def detect_pii_in_text_batch(
+    texts: list[str],
+    enabled_types: set[str] | None = None,
+    ner_strength: int = 3,
+) -> list[dict[str, list[PatternMatch]]]:
+    """
+    Detect PII in several texts at once.
+
+    Equivalent to calling detect_pii_in_text on each text, but each NER model runs
+    over the whole batch in one pass, which is considerably faster for many texts.
+
+    Args:
+        texts: Input texts to scan
+        enabled_types: Optional set of PII types to detect. If None, detects all types.
+        ner_strength: NER model strength (1, 2, or 3), see detect_pii_in_text.
+
+    Returns:
+        List of dictionaries mapping PII type to list of matches, one per input text.
+    """
+    all_types = _types_to_detect(enabled_types)
+
+    if not all_types:
+        return [{} for _ in texts]
+
+    if all_types <= CUSTOM_TYPES:
+        return [detect_with_secret_recognizers(text, enabled_types=all_types) for text in texts]
+
+    return detect_with_presidio_ensemble_batch(
+        texts, ner_strength=ner_strength, enabled_types=all_types
     )
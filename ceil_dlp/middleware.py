@@ -1,8 +1,15 @@
 """LiteLLM middleware implementation for ceil-dlp."""
 
+import asyncio
 import base64
+import hashlib
 import logging
 import os
+import threading
+from binascii import a2b_base64
+from collections import OrderedDict
+from collections.abc import Collection
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Literal
 
@@ -12,15 +19,45 @@ from litellm.proxy.proxy_server import UserAPIKeyAuth
 
 from ceil_dlp.audit import AuditLogger
 from ceil_dlp.config import Config, Policy
-from ceil_dlp.detectors.image_detector import detect_pii_in_image
-from ceil_dlp.detectors.model_matcher import matches_model
-from ceil_dlp.detectors.pdf_detector import detect_pii_in_pdf
-from ceil_dlp.detectors.text_detector import detect_pii_in_text
+from ceil_dlp.detectors.image_detector import (
+    image_detection_enabled,
+    ocr_concurrency,
+    try_detect_pii_in_images,
+)
+from ceil_dlp.detectors.model_matcher import compile_model_patterns
+from ceil_dlp.detectors.pdf_detector import try_detect_pii_in_pdf
+from ceil_dlp.detectors.text_detector import detect_pii_in_text_batch, may_have_pii_in_text
+from ceil_dlp.model_warmup import warmup
 from ceil_dlp.redaction import redact_image, redact_pdf, redact_text
 from ceil_dlp.whistledown import WhistledownCache, whistledown_transform_text
 
 logger = logging.getLogger(__name__)
 
+PIIDetections = dict[str, list[tuple[str, int, int]]]
+
+# (message_index, item_index, text) of a text part of the messages; item_index is None for
+# plain string content
+TextSegment = tuple[int, int | None, str]
+
+# Separator the text segments are joined with when extracted as a single text
+TEXT_SEGMENT_SEPARATOR = " "
+
+# Number of recent request payloads whose detections are kept, keyed by content digest
+DETECTION_CACHE_SIZE = 1024
+
+# Number of recent text segments whose detections are kept, keyed by content digest
+SEGMENT_DETECTION_CACHE_SIZE = 8192
+
+# (detections, [detections per text segment], [(image index, detections)],
+# [(pdf index, detections)]) for a payload. Indices rather than the image and PDF bytes are
+# cached, so payloads aren't kept alive
+_CachedDetections = tuple[
+    PIIDetections,
+    list[PIIDetections],
+    list[tuple[int, PIIDetections]],
+    list[tuple[int, PIIDetections]],
+]
+
 
 def create_handler(config_path: str | None = None, **kwargs) -> "CeilDLPHandler":
     """
@@ -43,6 +80,41 @@ def create_handler(config_path: str | None = None, **kwargs) -> "CeilDLPHandler"
     return CeilDLPHandler(config=config)
 
 
+def _select_types(detections: PIIDetections, pii_types: Collection[str]) -> PIIDetections:
+    """Get the detections of the given PII types."""
+    return {pii_type: matches for pii_type, matches in detections.items() if pii_type in pii_types}
+
+
+def _matched_texts(detections: PIIDetections) -> dict[str, list[str]]:
+    """Get the matched values per PII type, for audit logging."""
+    return {
+        pii_type: [match[0] for match in matches]
+        for pii_type, matches in detections.items()
+        if matches
+    }
+
+
+def _copy_detections(detections: PIIDetections) -> PIIDetections:
+    """Copy detections so the copy's match lists can be modified independently."""
+    return {pii_type: list(matches) for pii_type, matches in detections.items()}
+
+
+def _decode_data_url(url: str) -> bytes | None:
+    """Decode the base64 payload of a data URL (data:<mime type>;base64,<data>).
+
+    Returns None, logging a warning, if the URL has no payload or it is not valid base64.
+    """
+    _header, separator, data = url.partition(",")
+    if not separator:
+        logger.warning("Failed to decode base64 data URL: no data after the header")
+        return None
+    try:
+        return a2b_base64(data)
+    except ValueError as e:
+        logger.warning(f"Failed to decode base64 data URL: {e}")
+        return None
+
+
 class CeilDLPHandler(CustomLogger):
     """LiteLLM custom logger that implements DLP functionality."""
 
@@ -91,13 +163,44 @@ class CeilDLPHandler(CustomLogger):
             # No parameters, use defaults
             self.config = Config()
 
-        # Store enabled_types for PII detection
+        # Store enabled_types for PII detection, built once and shared by every request
         self.enabled_types = (
             set(self.config.enabled_pii_types) if self.config.enabled_pii_types else None
         )
+        # Without an enabled default policy, only types with an enabled policy are ever acted
+        # on, so detection is narrowed to them. With none at all, detection is skipped
+        default_policy = self.config.default_policy
+        if default_policy is None or not default_policy.enabled:
+            policy_types = {
+                pii_type for pii_type, policy in self.config.policies.items() if policy.enabled
+            }
+            self.enabled_types = (
+                policy_types if self.enabled_types is None else self.enabled_types & policy_types
+            )
         self.audit_logger = AuditLogger(log_path=self.config.audit_log_path)
         self.whistledown_cache = WhistledownCache()
 
+        # Agent loops and prompt templates resend the same payloads, so detections are
+        # cached by content digest. Policies are still applied on every request.
+        self._detection_cache: OrderedDict[bytes, _CachedDetections] = OrderedDict()
+        # Conversations resend their whole history every turn, so detections are also cached
+        # per text segment and only new messages go through the NER models
+        self._segment_detection_cache: OrderedDict[bytes, PIIDetections] = OrderedDict()
+        self._detection_cache_lock = threading.Lock()
+
+        # Load models in the background so proxy startup isn't blocked
+        # but the first request finds the model caches hot
+        if self.config.warmup:
+            threading.Thread(
+                target=warmup,
+                kwargs={
+                    "ner_strength": self.config.ner_strength,
+                    "include_image": image_detection_enabled(),
+                },
+                name="ceil-dlp-warmup",
+                daemon=True,
+            ).start()
+
         # Log initialization
         logger.info(
             "\n[ ceil-dlp plugin initialized ]\n",
@@ -117,23 +220,191 @@ class CeilDLPHandler(CustomLogger):
         if policy.models is None:
             return True  # No model rules specified, apply policy by default
 
+        # Pattern lists are compiled once and cached, rather than matched one by one
+        block, allow = policy.models.block, policy.models.allow
+
         # Check block list first (explicit blocks take precedence)
-        if policy.models.block:
-            for pattern in policy.models.block:
-                if matches_model(model, pattern):
-                    return True  # Model matches block list, apply policy
+        if block and compile_model_patterns(tuple(block)).matches(model):
+            return True  # Model matches block list, apply policy
 
         # Check allow list (explicit allows override policy)
-        if policy.models.allow:
-            for pattern in policy.models.allow:
-                if matches_model(model, pattern):
-                    return False  # Model matches allow list, skip policy
+        if allow and compile_model_patterns(tuple(allow)).matches(model):
+            return False  # Model matches allow list, skip policy
 
         # Default behavior:
         # If block list exists but model doesn't match: don't apply policy
         # If only allow list exists and model doesn't match: apply policy
         return policy.models.block is None
 
+    def _detection_settings(self) -> str:
+        """Detection settings that detection cache keys depend on besides the content."""
+        return f"{self.config.ner_strength}|{sorted(self.enabled_types or ())}"
+
+    def _detection_cache_key(
+        self, texts: list[str], images: list[bytes], pdfs: list[bytes]
+    ) -> bytes:
+        """Digest of everything detection depends on: the content and detection settings."""
+        digest = hashlib.blake2b(digest_size=16)
+        settings = self._detection_settings()
+        digest.update(f"{settings}|{len(texts)}|{len(images)}|{len(pdfs)}".encode())
+        # Length-prefix each part so different splits of the same bytes get different keys
+        for part in (*(text.encode() for text in texts), *images, *pdfs):
+            digest.update(len(part).to_bytes(8, "little"))
+            digest.update(part)
+        return digest.digest()
+
+    def _detect_pii(
+        self, texts: list[str], images: list[bytes], pdfs: list[bytes]
+    ) -> tuple[
+        PIIDetections,
+        list[PIIDetections],
+        list[tuple[bytes, PIIDetections]],
+        list[tuple[bytes, PIIDetections]],
+    ]:
+        """
+        Detect PII in extracted message content, reusing results for repeated payloads.
+
+        Args:
+            texts: Text segments extracted from the messages
+            images: Images extracted from the messages
+            pdfs: PDFs extracted from the messages
+
+        Returns:
+            Tuple of (detections, segment_detections, images_with_pii, pdfs_with_pii) where
+            detections merges text, image, and PDF detections, segment_detections holds the
+            detections of each text segment with offsets relative to it, and images_with_pii
+            and pdfs_with_pii are lists of (data, detections) tuples
+        """
+        key = self._detection_cache_key(texts, images, pdfs)
+        with self._detection_cache_lock:
+            cached = self._detection_cache.get(key)
+            if cached is not None:
+                self._detection_cache.move_to_end(key)
+
+        if cached is None:
+            cached, complete = self._detect_pii_uncached(texts, images, pdfs)
+            # A payload whose image or PDF detection failed is detected again next time,
+            # instead of a transient failure letting it through for as long as it's cached
+            if complete:
+                with self._detection_cache_lock:
+                    self._detection_cache[key] = cached
+                    self._detection_cache.move_to_end(key)
+                    if len(self._detection_cache) > DETECTION_CACHE_SIZE:
+                        self._detection_cache.popitem(last=False)
+
+        # Hand out copies so callers can't modify the cached detections
+        detections, segment_detections, image_hits, pdf_hits = cached
+        return (
+            _copy_detections(detections),
+            [_copy_detections(segment) for segment in segment_detections],
+            [(images[i], _copy_detections(hit)) for i, hit in image_hits],
+            [(pdfs[i], _copy_detections(hit)) for i, hit in pdf_hits],
+        )
+
+    def _detect_pii_uncached(
+        self, texts: list[str], images: list[bytes], pdfs: list[bytes]
+    ) -> tuple[_CachedDetections, bool]:
+        """Run text, image, and PDF PII detection on extracted message content.
+
+        Returns:
+            Tuple of (detections, complete) where complete is False if detection failed for
+            any image or any part of a PDF, so the detections shouldn't be cached.
+        """
+
+        def detect_texts() -> list[PIIDetections]:
+            # Detect PII in each text segment, so matches keep offsets into their own segment
+            # and the messages never have to be joined into one text. Segments seen before,
+            # such as earlier turns of a conversation, reuse their detections, and the NER
+            # models run over the remaining distinct segments in one batch
+            if not texts:
+                return []
+            settings = self._detection_settings().encode()
+            keys = [
+                hashlib.blake2b(settings + b"|" + text.encode(), digest_size=16).digest()
+                for text in texts
+            ]
+            known: dict[bytes, PIIDetections] = {}
+            with self._detection_cache_lock:
+                for key in keys:
+                    cached = self._segment_detection_cache.get(key)
+                    if cached is not None:
+                        self._segment_detection_cache.move_to_end(key)
+                        known[key] = cached
+
+            new_texts = {
+                key: text for key, text in zip(keys, texts, strict=True) if key not in known
+            }
+            if new_texts:
+                new_detections = detect_pii_in_text_batch(
+                    list(new_texts.values()),
+                    enabled_types=self.enabled_types,
+                    ner_strength=self.config.ner_strength,
+                )
+                with self._detection_cache_lock:
+                    for key, detected in zip(new_texts, new_detections, strict=True):
+                        known[key] = self._segment_detection_cache[key] = detected
+                        self._segment_detection_cache.move_to_end(key)
+                    while len(self._segment_detection_cache) > SEGMENT_DETECTION_CACHE_SIZE:
+                        self._segment_detection_cache.popitem(last=False)
+            return [known[key] for key in keys]
+
+        def detect_images() -> tuple[list[PIIDetections], bool]:
+            # Images are OCR'd in batches, results come back in message order
+            if not images:
+                return [], True
+            results = try_detect_pii_in_images(images, enabled_types=self.enabled_types)
+            complete = all(result is not None for result in results)
+            return [{} if result is None else result for result in results], complete
+
+        def detect_pdfs() -> tuple[list[PIIDetections], bool]:
+            results = [
+                try_detect_pii_in_pdf(pdf_data, enabled_types=self.enabled_types)
+                for pdf_data in pdfs
+            ]
+            return [detections for detections, _ in results], all(ok for _, ok in results)
+
+        if images or pdfs:
+            # Text, image, and PDF detection are independent, so OCR of images and PDFs runs
+            # on worker threads while the text is detected on this one
+            with ThreadPoolExecutor(max_workers=2, thread_name_prefix="ceil-dlp-detect") as pool:
+                image_future = pool.submit(detect_images)
+                pdf_future = pool.submit(detect_pdfs)
+                segment_detections = detect_texts()
+                all_image_detections, images_complete = image_future.result()
+                all_pdf_detections, pdfs_complete = pdf_future.result()
+        else:
+            segment_detections = detect_texts()
+            all_image_detections = all_pdf_detections = []
+            images_complete = pdfs_complete = True
+
+        detections: PIIDetections = {}
+        for segment in segment_detections:
+            for pii_type, matches in segment.items():
+                detections.setdefault(pii_type, []).extend(matches)
+
+        # Track which images have PII
+        image_hits: list[tuple[int, PIIDetections]] = []
+        for image_index, image_detections in enumerate(all_image_detections):
+            if image_detections:
+                # Track this image and its detections
+                image_hits.append((image_index, image_detections))
+            # Merge image detections with text detections
+            for pii_type, matches in image_detections.items():
+                detections.setdefault(pii_type, []).extend(matches)
+
+        # Track which PDFs have PII
+        pdf_hits: list[tuple[int, PIIDetections]] = []
+        for pdf_index, pdf_detections in enumerate(all_pdf_detections):
+            if pdf_detections:
+                # Track this PDF and its detections
+                pdf_hits.append((pdf_index, pdf_detections))
+            # Merge PDF detections with text detections
+            for pii_type, matches in pdf_detections.items():
+                detections.setdefault(pii_type, []).extend(matches)
+
+        complete = images_complete and pdfs_complete
+        return (detections, segment_detections, image_hits, pdf_hits), complete
+
     def _process_pii_detection(
         self,
         messages: list[Any],
@@ -143,7 +414,9 @@ class CeilDLPHandler(CustomLogger):
         list[str],
         dict[str, list[tuple[str, int, int]]],
         dict[str, list[tuple[str, int, int]]],
-        str,
+        dict[str, list[tuple[str, int, int]]],
+        list[TextSegment],
+        list[dict[str, list[tuple[str, int, int]]]],
         list[tuple[bytes, dict[str, list[tuple[str, int, int]]]]],
         list[tuple[bytes, dict[str, list[tuple[str, int, int]]]]],
     ]:
@@ -155,66 +428,46 @@ class CeilDLPHandler(CustomLogger):
             model: Model name
 
         Returns:
-            Tuple of (detections, blocked_types, masked_types, whistledown_types, text_content, images_with_pii, pdfs_with_pii)
-            where images_with_pii and pdfs_with_pii are lists of (data, detections) tuples
+            Tuple of (detections, blocked_types, masked_types, whistledown_types, applied_types, segments, segment_detections, images_with_pii, pdfs_with_pii)
+            where applied_types holds the detections of every type whose policy applies to the
+            model, whatever its action, segments are the text segments of the messages and
+            segment_detections their detections, and images_with_pii and pdfs_with_pii are
+            lists of (data, detections) tuples
         """
         # Extract text, images, and PDFs from messages
-        text_content = self._extract_text_from_messages(messages)
-        images = self._extract_images_from_messages(messages)
+        segments = self._extract_text_segments(messages)
+        if self.enabled_types is not None and not self.enabled_types:
+            # No enabled policy could act on a detection, so don't look for any
+            return {}, [], {}, {}, {}, segments, [{} for _ in segments], [], []
+
+        # Skip decoding images entirely when image detection is disabled
+        images = self._extract_images_from_messages(messages) if image_detection_enabled() else []
         pdfs = self._extract_pdfs_from_messages(messages)
 
-        # Detect PII in text
-        detections = (
-            detect_pii_in_text(
-                text_content,
-                enabled_types=self.enabled_types,
-                ner_strength=self.config.ner_strength,
+        texts = [text for _, _, text in segments]
+        if (
+            not images
+            and not pdfs
+            and not any(
+                may_have_pii_in_text(text, enabled_types=self.enabled_types) for text in texts
             )
-            if text_content
-            else {}
-        )
+        ):
+            # Plain prose with no PII anchors, so skip detection (and digesting the payload
+            # for the detection cache) altogether
+            return {}, [], {}, {}, {}, segments, [{} for _ in segments], [], []
 
-        # Detect PII in images and track which images have PII
-        images_with_pii: list[tuple[bytes, dict[str, list[tuple[str, int, int]]]]] = []
-        if images:
-            enabled_types = (
-                set(self.config.enabled_pii_types) if self.config.enabled_pii_types else None
-            )
-            for image_data in images:
-                image_detections = detect_pii_in_image(image_data, enabled_types=enabled_types)
-                if image_detections:
-                    # Track this image and its detections
-                    images_with_pii.append((image_data, image_detections))
-                # Merge image detections with text detections
-                for pii_type, matches in image_detections.items():
-                    if pii_type not in detections:
-                        detections[pii_type] = []
-                    detections[pii_type].extend(matches)
-
-        # Detect PII in PDFs and track which PDFs have PII
-        pdfs_with_pii: list[tuple[bytes, dict[str, list[tuple[str, int, int]]]]] = []
-        if pdfs:
-            enabled_types = (
-                set(self.config.enabled_pii_types) if self.config.enabled_pii_types else None
-            )
-            for pdf_data in pdfs:
-                pdf_detections = detect_pii_in_pdf(pdf_data, enabled_types=enabled_types)
-                if pdf_detections:
-                    # Track this PDF and its detections
-                    pdfs_with_pii.append((pdf_data, pdf_detections))
-                # Merge PDF detections with text detections
-                for pii_type, matches in pdf_detections.items():
-                    if pii_type not in detections:
-                        detections[pii_type] = []
-                    detections[pii_type].extend(matches)
+        detections, segment_detections, images_with_pii, pdfs_with_pii = self._detect_pii(
+            texts, images, pdfs
+        )
 
         if not detections:
-            return {}, [], {}, {}, text_content, [], []
+            return {}, [], {}, {}, {}, segments, segment_detections, [], []
 
-        # Check policies and determine actions
+        # Check policies once per detected type and determine actions
         blocked_types = []
         masked_types = {}
         whistledown_types = {}
+        applied_types = {}
 
         for pii_type, matches in detections.items():
             policy = self.config.get_policy(pii_type)
@@ -225,6 +478,7 @@ class CeilDLPHandler(CustomLogger):
             if not self._should_apply_policy(policy, model):
                 continue  # Skip this policy for this model
 
+            applied_types[pii_type] = matches
             if policy.action == "block":
                 blocked_types.append(pii_type)
             elif policy.action == "mask":
@@ -237,7 +491,9 @@ class CeilDLPHandler(CustomLogger):
             blocked_types,
             masked_types,
             whistledown_types,
-            text_content,
+            applied_types,
+            segments,
+            segment_detections,
             images_with_pii,
             pdfs_with_pii,
         )
@@ -291,16 +547,19 @@ class CeilDLPHandler(CustomLogger):
                 logger.debug(f"Skipping non-completion call_type: {call_type}")
                 return data
 
-            # Use shared detection logic
+            # Use shared detection logic. It runs OCR and NER models, so it runs on a worker
+            # thread rather than blocking the proxy's event loop
             (
                 detections,
                 blocked_types,
                 masked_types,
                 whistledown_types,
-                text_content,
+                applied_types,
+                segments,
+                segment_detections,
                 images_with_pii,
                 pdfs_with_pii,
-            ) = self._process_pii_detection(messages, model)
+            ) = await asyncio.to_thread(self._process_pii_detection, messages, model)
 
             logger.debug(
                 f"CeilDLP detection results: detections={list(detections.keys())}, "
@@ -318,22 +577,18 @@ class CeilDLPHandler(CustomLogger):
 
             # Handle based on mode
             if mode == "observe":
-                # Observe mode: log all detections but never block or mask
-                for pii_type, matches in detections.items():
-                    policy = self.config.get_policy(pii_type)
-                    if policy and policy.enabled:
-                        # Check model-aware policy
-                        if not self._should_apply_policy(policy, model):
-                            continue  # Skip this policy for this model
-                        matched_texts = [match[0] for match in matches]
-                        self.audit_logger.log_detection(
-                            user_id=user_id,
-                            pii_type=pii_type,
-                            action="observe",
-                            redacted_items=matched_texts,
-                            request_id=data.get("litellm_call_id"),
-                            mode=mode,
-                        )
+                # Observe mode: log all detections with an applicable policy but never block
+                # or mask
+                for pii_type, matches in applied_types.items():
+                    matched_texts = [match[0] for match in matches]
+                    self.audit_logger.log_detection(
+                        user_id=user_id,
+                        pii_type=pii_type,
+                        action="observe",
+                        redacted_items=matched_texts,
+                        request_id=data.get("litellm_call_id"),
+                        mode=mode,
+                    )
                 # Always allow request in observe mode
                 return data
 
@@ -351,29 +606,38 @@ class CeilDLPHandler(CustomLogger):
 
                 # Apply masking for medium-risk PII
                 if masked_types:
-                    redacted_text, redacted_items = redact_text(
-                        text_content, detections=masked_types, ner_strength=self.config.ner_strength
-                    )
+                    # Redact each message segment separately and write it back in place
+                    redacted_texts = [
+                        redact_text(text, detections=_select_types(detected, masked_types))[0]
+                        for (_, _, text), detected in zip(segments, segment_detections, strict=True)
+                    ]
+                    redacted_items = _matched_texts(masked_types)
 
                     # Update messages with redacted text
                     modified_messages = self._replace_text_in_messages(
-                        messages, text_content, redacted_text
+                        messages, segments, redacted_texts
                     )
 
                     # Redact images that have PII detected
                     if images_with_pii:
                         # Determine which PII types in images should be masked
                         image_pii_types_to_mask = set(masked_types.keys())
-                        modified_messages = self._redact_images_in_messages(
-                            modified_messages, images_with_pii, image_pii_types_to_mask
+                        modified_messages = await asyncio.to_thread(
+                            self._redact_images_in_messages,
+                            modified_messages,
+                            images_with_pii,
+                            image_pii_types_to_mask,
                         )
 
                     # Redact PDFs that have PII detected
                     if pdfs_with_pii:
                         # Determine which PII types in PDFs should be masked
                         pdf_pii_types_to_mask = set(masked_types.keys())
-                        modified_messages = self._redact_pdfs_in_messages(
-                            modified_messages, pdfs_with_pii, pdf_pii_types_to_mask
+                        modified_messages = await asyncio.to_thread(
+                            self._redact_pdfs_in_messages,
+                            modified_messages,
+                            pdfs_with_pii,
+                            pdf_pii_types_to_mask,
                         )
 
                     data["messages"] = modified_messages
@@ -391,30 +655,41 @@ class CeilDLPHandler(CustomLogger):
 
                 if whistledown_types:
                     request_id = data.get("litellm_call_id", "unknown")
-                    transformed_text, transformed_items = whistledown_transform_text(
-                        text_content,
-                        detections=whistledown_types,
-                        cache=self.whistledown_cache,
-                        request_id=request_id,
-                    )
+                    # Transform each message segment separately and write it back in place
+                    transformed_texts = [
+                        whistledown_transform_text(
+                            text,
+                            detections=_select_types(detected, whistledown_types),
+                            cache=self.whistledown_cache,
+                            request_id=request_id,
+                        )[0]
+                        for (_, _, text), detected in zip(segments, segment_detections, strict=True)
+                    ]
+                    transformed_items = _matched_texts(whistledown_types)
 
                     # Update messages with transformed text
                     modified_messages = self._replace_text_in_messages(
-                        messages, text_content, transformed_text
+                        messages, segments, transformed_texts
                     )
 
                     # Note(jadidbourbaki): Images and PDFs with Whistledown action fall back to masking
                     # since overlaying replacement tokens on images is complex
                     if images_with_pii:
                         image_pii_types_to_mask = set(whistledown_types.keys())
-                        modified_messages = self._redact_images_in_messages(
-                            modified_messages, images_with_pii, image_pii_types_to_mask
+                        modified_messages = await asyncio.to_thread(
+                            self._redact_images_in_messages,
+                            modified_messages,
+                            images_with_pii,
+                            image_pii_types_to_mask,
                         )
 
                     if pdfs_with_pii:
                         pdf_pii_types_to_mask = set(whistledown_types.keys())
-                        modified_messages = self._redact_pdfs_in_messages(
-                            modified_messages, pdfs_with_pii, pdf_pii_types_to_mask
+                        modified_messages = await asyncio.to_thread(
+                            self._redact_pdfs_in_messages,
+                            modified_messages,
+                            pdfs_with_pii,
+                            pdf_pii_types_to_mask,
                         )
 
                     data["messages"] = modified_messages
@@ -495,29 +770,44 @@ class CeilDLPHandler(CustomLogger):
             logger.error(f"error in post_call_hook: {e}", exc_info=True)
             return None
 
-    def _extract_text_from_messages(self, messages: list[Any]) -> str:
-        """Extract text content from LiteLLM messages format."""
-        text_parts = []
-        for msg in messages:
+    def _extract_text_segments(self, messages: list[Any]) -> list[TextSegment]:
+        """
+        Extract the text segments of LiteLLM messages along with where each came from.
+
+        Args:
+            messages: List of messages
+
+        Returns:
+            List of (message_index, item_index, text) tuples, where item_index is the index
+            of the text item in multimodal content, or None for plain string content
+        """
+        segments: list[TextSegment] = []
+        for msg_index, msg in enumerate(messages):
             if isinstance(msg, dict):
                 content = msg.get("content")
                 if content is None:
                     continue
                 if isinstance(content, str):
                     if content:  # Only add non-empty strings
-                        text_parts.append(content)
+                        segments.append((msg_index, None, content))
                 elif isinstance(content, list):
                     # Handle multimodal content (OpenAI format)
-                    for item in content:
+                    for item_index, item in enumerate(content):
                         if isinstance(item, dict) and item.get("type") == "text":
                             text_value = item.get("text", "")
                             if text_value:  # Only add non-empty text
-                                text_parts.append(text_value)
+                                segments.append((msg_index, item_index, text_value))
             elif isinstance(msg, str):
                 if msg:  # Only add non-empty strings
-                    text_parts.append(msg)
+                    segments.append((msg_index, None, msg))
+
+        return segments
 
-        return " ".join(text_parts)
+    def _extract_text_from_messages(self, messages: list[Any]) -> str:
+        """Extract text content from LiteLLM messages format."""
+        return TEXT_SEGMENT_SEPARATOR.join(
+            text for _, _, text in self._extract_text_segments(messages)
+        )
 
     def _extract_images_from_messages(self, messages: list[Any]) -> list[bytes]:
         """
@@ -554,14 +844,10 @@ class CeilDLPHandler(CustomLogger):
                     image_url_data = item.get("image_url", {})
                     url = image_url_data.get("url", "") if isinstance(image_url_data, dict) else ""
                     if url.startswith("data:image"):
-                        # Base64-encoded image
-                        try:
-                            # Extract base64 data (format: data:image/png;base64,<data>)
-                            header, data = url.split(",", 1)
-                            image_bytes = base64.b64decode(data)
+                        # Base64-encoded image (format: data:image/png;base64,<data>)
+                        image_bytes = _decode_data_url(url)
+                        if image_bytes is not None:
                             images.append(image_bytes)
-                        except Exception as e:
-                            logger.warning(f"Failed to decode base64 image: {e}")
                     # TODO(jadidbourbaki): would do we do with image URLs? Do we need to download them?
 
                 elif item_type == "image":
@@ -570,12 +856,9 @@ class CeilDLPHandler(CustomLogger):
                     if isinstance(image_data, bytes):
                         images.append(image_data)
                     elif isinstance(image_data, str) and image_data.startswith("data:image"):
-                        try:
-                            _header, data = image_data.split(",", 1)
-                            image_bytes = base64.b64decode(data)
+                        image_bytes = _decode_data_url(image_data)
+                        if image_bytes is not None:
                             images.append(image_bytes)
-                        except Exception as e:
-                            logger.warning(f"Failed to decode base64 image: {e}")
 
         return images
 
@@ -616,21 +899,15 @@ class CeilDLPHandler(CustomLogger):
                         url = file_data.get("url", "")
                         if url.startswith("data:application/pdf"):
                             # Base64-encoded PDF
-                            try:
-                                header, data = url.split(",", 1)
-                                pdf_bytes = base64.b64decode(data)
+                            pdf_bytes = _decode_data_url(url)
+                            if pdf_bytes is not None:
                                 pdfs.append(pdf_bytes)
-                            except Exception as e:
-                                logger.warning(f"Failed to decode base64 PDF: {e}")
                     elif isinstance(file_data, str) and file_data.startswith(
                         "data:application/pdf"
                     ):
-                        try:
-                            header, data = file_data.split(",", 1)
-                            pdf_bytes = base64.b64decode(data)
+                        pdf_bytes = _decode_data_url(file_data)
+                        if pdf_bytes is not None:
                             pdfs.append(pdf_bytes)
-                        except Exception as e:
-                            logger.warning(f"Failed to decode base64 PDF: {e}")
                 elif item_type == "pdf_url" or item_type == "document_url":
                     # Direct PDF URL
                     url_data = item.get("pdf_url") or item.get("document_url", {})
@@ -640,43 +917,46 @@ class CeilDLPHandler(CustomLogger):
                         else (url_data if isinstance(url_data, str) else "")
                     )
                     if url.startswith("data:application/pdf"):
-                        try:
-                            _header, data = url.split(",", 1)
-                            pdf_bytes = base64.b64decode(data)
+                        pdf_bytes = _decode_data_url(url)
+                        if pdf_bytes is not None:
                             pdfs.append(pdf_bytes)
-                        except Exception as e:
-                            logger.warning(f"Failed to decode base64 PDF: {e}")
 
                     # TODO(jadidbourbaki): would do we do with PDF URLs? Do we need to download them?
 
         return pdfs
 
     def _replace_text_in_messages(
-        self, messages: list[Any], old_text: str, new_text: str
+        self, messages: list[Any], segments: list[TextSegment], new_texts: list[str]
     ) -> list[Any]:
-        """Replace text in messages while preserving structure."""
-        modified = []
-        for msg in messages:
-            if not isinstance(msg, dict):
-                # String message - convert to dict format
-                modified.append({"content": str(msg).replace(old_text, new_text)})
+        """
+        Write new text back into the message segments it was extracted from.
+
+        Args:
+            messages: List of messages
+            segments: Text segments from _extract_text_segments
+            new_texts: Replacement text for each segment
+
+        Returns:
+            Copy of the messages with the segments replaced, preserving structure
+        """
+        modified: list[dict[str, Any]] = [
+            msg.copy() if isinstance(msg, dict) else {"content": str(msg)} for msg in messages
+        ]
+        copied_content: set[int] = set()
+        for (msg_index, item_index, text), new_text in zip(segments, new_texts, strict=True):
+            if new_text == text:
                 continue
-            new_msg = msg.copy()
-            content = msg.get("content", "")
-            if isinstance(content, str):
-                new_msg["content"] = content.replace(old_text, new_text)
-            elif isinstance(content, list):
-                # Handle multimodal content
-                new_content = []
-                for item in content:
-                    if isinstance(item, dict) and item.get("type") == "text":
-                        new_item = item.copy()
-                        new_item["text"] = item.get("text", "").replace(old_text, new_text)
-                        new_content.append(new_item)
-                    else:
-                        new_content.append(item)
-                new_msg["content"] = new_content
-            modified.append(new_msg)
+            new_msg = modified[msg_index]
+            if item_index is None:
+                new_msg["content"] = new_text
+                continue
+            # Handle multimodal content, copying the content list once per message
+            if msg_index not in copied_content:
+                new_msg["content"] = list(new_msg["content"])
+                copied_content.add(msg_index)
+            new_item = new_msg["content"][item_index].copy()
+            new_item["text"] = new_text
+            new_msg["content"][item_index] = new_item
         return modified
 
     def _redact_images_in_messages(
@@ -700,25 +980,36 @@ class CeilDLPHandler(CustomLogger):
         # Create a mapping of original image bytes to redacted image bytes
         image_redaction_map: dict[bytes, bytes] = {}
 
+        def redact(image_data: bytes, types_to_redact: list[str]) -> None:
+            try:
+                image_redaction_map[image_data] = redact_image(
+                    image_data,
+                    pii_types=types_to_redact,
+                    ocr_strength=self.config.ocr_strength,
+                    ner_strength=self.config.ner_strength,
+                )
+                logger.debug(f"Redacted image with PII types: {types_to_redact}")
+            except Exception as e:
+                logger.error(f"Failed to redact image: {e}", exc_info=True)
+                # Continue with original image on error
+
+        to_redact: list[tuple[bytes, list[str]]] = []
         for image_data, image_detections in images_with_pii:
             # Check if this image has any PII types that should be masked
             image_pii_types = set(image_detections.keys())
             if image_pii_types.intersection(pii_types_to_mask):
-                # This image has PII that should be masked, redact it
-                try:
-                    # Get the PII types in this image that need masking
-                    types_to_redact = list(image_pii_types.intersection(pii_types_to_mask))
-                    redacted_image = redact_image(
-                        image_data,
-                        pii_types=types_to_redact,
-                        ocr_strength=self.config.ocr_strength,
-                        ner_strength=self.config.ner_strength,
-                    )
-                    image_redaction_map[image_data] = redacted_image
-                    logger.debug(f"Redacted image with PII types: {types_to_redact}")
-                except Exception as e:
-                    logger.error(f"Failed to redact image: {e}", exc_info=True)
-                    # Continue with original image on error
+                # Get the PII types in this image that need masking
+                to_redact.append(
+                    (image_data, list(image_pii_types.intersection(pii_types_to_mask)))
+                )
+
+        # Each image's OCR passes are independent, so images are redacted concurrently
+        if len(to_redact) == 1:
+            redact(*to_redact[0])
+        elif to_redact:
+            workers = min(len(to_redact), ocr_concurrency())
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ceil-dlp-ocr") as pool:
+                list(pool.map(lambda args: redact(*args), to_redact))
 
         if not image_redaction_map:
             # No images to redact
@@ -754,23 +1045,19 @@ class CeilDLPHandler(CustomLogger):
                         new_content.append(item)
                         continue
 
-                    try:
-                        header, data = url.split(",", 1)
-                        image_bytes = base64.b64decode(data)
-
-                        if image_bytes in image_redaction_map:
-                            # Replace with redacted image
-                            redacted_image = image_redaction_map[image_bytes]
-                            redacted_base64 = base64.b64encode(redacted_image).decode("utf-8")
+                    image_bytes = _decode_data_url(url)
+                    if image_bytes is not None and image_bytes in image_redaction_map:
+                        # Replace with redacted image
+                        redacted_image = image_redaction_map[image_bytes]
+                        redacted_base64 = base64.b64encode(redacted_image).decode("utf-8")
 
-                            # Preserve the original header (data:image/png;base64)
-                            new_url = f"{header},{redacted_base64}"
-                            new_item = item.copy()
-                            new_item["image_url"] = {"url": new_url}
-                            new_content.append(new_item)
-                            continue
-                    except Exception as e:
-                        logger.warning(f"Failed to process image URL: {e}")
+                        # Preserve the original header (data:image/png;base64)
+                        header = url.partition(",")[0]
+                        new_url = f"{header},{redacted_base64}"
+                        new_item = item.copy()
+                        new_item["image_url"] = {"url": new_url}
+                        new_content.append(new_item)
+                        continue
 
                 # Handle image type (direct image data)
                 elif item_type == "image":
@@ -780,11 +1067,7 @@ class CeilDLPHandler(CustomLogger):
                     if isinstance(image_data, bytes):
                         image_bytes_direct = image_data
                     elif isinstance(image_data, str) and image_data.startswith("data:image"):
-                        try:
-                            header, data = image_data.split(",", 1)
-                            image_bytes_direct = base64.b64decode(data)
-                        except Exception as e:
-                            logger.warning(f"Failed to decode base64 image: {e}")
+                        image_bytes_direct = _decode_data_url(image_data)
 
                     if image_bytes_direct and image_bytes_direct in image_redaction_map:
                         # Replace with redacted image
@@ -793,7 +1076,7 @@ class CeilDLPHandler(CustomLogger):
 
                         # Preserve the original format
                         if isinstance(image_data, str) and image_data.startswith("data:image"):
-                            header, _ = image_data.split(",", 1)
+                            header = image_data.partition(",")[0]
                             new_image_data = f"{header},{redacted_base64}"
                         else:
                             # If it was bytes, convert to base64 data URL
@@ -891,26 +1174,22 @@ class CeilDLPHandler(CustomLogger):
                         new_content.append(item)
                         continue
 
-                    try:
-                        header, data = url.split(",", 1)
-                        pdf_bytes = base64.b64decode(data)
-
-                        if pdf_bytes in pdf_redaction_map:
-                            # Replace with redacted PDF
-                            redacted_pdf = pdf_redaction_map[pdf_bytes]
-                            redacted_base64 = base64.b64encode(redacted_pdf).decode("utf-8")
-
-                            # Preserve the original header (data:application/pdf;base64)
-                            new_url = f"{header},{redacted_base64}"
-                            new_item = item.copy()
-                            if isinstance(file_data, dict):
-                                new_item["file"] = {"url": new_url}
-                            else:
-                                new_item["file"] = new_url
-                            new_content.append(new_item)
-                            continue
-                    except Exception as e:
-                        logger.warning(f"Failed to process PDF URL: {e}")
+                    pdf_bytes = _decode_data_url(url)
+                    if pdf_bytes is not None and pdf_bytes in pdf_redaction_map:
+                        # Replace with redacted PDF
+                        redacted_pdf = pdf_redaction_map[pdf_bytes]
+                        redacted_base64 = base64.b64encode(redacted_pdf).decode("utf-8")
+
+                        # Preserve the original header (data:application/pdf;base64)
+                        header = url.partition(",")[0]
+                        new_url = f"{header},{redacted_base64}"
+                        new_item = item.copy()
+                        if isinstance(file_data, dict):
+                            new_item["file"] = {"url": new_url}
+                        else:
+                            new_item["file"] = new_url
+                        new_content.append(new_item)
+                        continue
 
                 # Handle pdf_url/document_url type (direct PDF URL)
                 elif item_type in ("pdf_url", "document_url"):
@@ -925,26 +1204,22 @@ class CeilDLPHandler(CustomLogger):
                         new_content.append(item)
                         continue
 
-                    try:
-                        header, data = url.split(",", 1)
-                        pdf_bytes = base64.b64decode(data)
-
-                        if pdf_bytes in pdf_redaction_map:
-                            # Replace with redacted PDF
-                            redacted_pdf = pdf_redaction_map[pdf_bytes]
-                            redacted_base64 = base64.b64encode(redacted_pdf).decode("utf-8")
-
-                            # Preserve the original header
-                            new_url = f"{header},{redacted_base64}"
-                            new_item = item.copy()
-                            if item_type == "pdf_url":
-                                new_item["pdf_url"] = {"url": new_url}
-                            else:
-                                new_item["document_url"] = {"url": new_url}
-                            new_content.append(new_item)
-                            continue
-                    except Exception as e:
-                        logger.warning(f"Failed to process PDF URL: {e}")
+                    pdf_bytes = _decode_data_url(url)
+                    if pdf_bytes is not None and pdf_bytes in pdf_redaction_map:
+                        # Replace with redacted PDF
+                        redacted_pdf = pdf_redaction_map[pdf_bytes]
+                        redacted_base64 = base64.b64encode(redacted_pdf).decode("utf-8")
+
+                        # Preserve the original header
+                        header = url.partition(",")[0]
+                        new_url = f"{header},{redacted_base64}"
+                        new_item = item.copy()
+                        if item_type == "pdf_url":
+                            new_item["pdf_url"] = {"url": new_url}
+                        else:
+                            new_item["document_url"] = {"url": new_url}
+                        new_content.append(new_item)
+                        continue
 
                 # Keep non-PDF items and unredacted PDFs as-is
                 new_content.append(item)
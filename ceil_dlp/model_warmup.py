@@ -0,0 +1,38 @@
+"""Model warmup to avoid paying model load time on the first request."""
+
+import logging
+
+from ceil_dlp.detectors.doctr_ocr import get_doctr_ocr_engine
+from ceil_dlp.detectors.image_detector import get_image_analyzer
+from ceil_dlp.detectors.presidio_adapter import get_analyzer
+
+logger = logging.getLogger(__name__)
+
+
+def warmup(ner_strength: int = 1, include_image: bool = False) -> None:
+    """Load and exercise the detection models so their caches are hot.
+
+    The analyzers are cached but only built on first use, so without warmup the first
+    request pays several seconds of spaCy/transformer/OCR model loading. Errors are
+    logged rather than raised so warmup can safely run in a background thread.
+
+    Args:
+        ner_strength: NER model strength used for detection (1, 2, or 3). The analyzers
+                      for every strength up to this one are loaded, matching the ensemble.
+        include_image: Whether to also load the image analyzer and its OCR model.
+
+    Returns:
+        None
+    """
+    try:
+        for strength in range(1, ner_strength + 1):
+            # A trivial analysis forces lazily-loaded submodels to initialize
+            get_analyzer(ner_strength=strength).analyze(text="warmup", language="en")
+
+        if include_image:
+            get_image_analyzer()
+            _ = get_doctr_ocr_engine().model
+
+        logger.debug(f"ceil-dlp models warmed up (ner_strength={ner_strength})")
+    except Exception as e:
+        logger.warning(f"ceil-dlp model warmup failed: {e}")
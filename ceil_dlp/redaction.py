@@ -2,6 +2,8 @@
 
 import io
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import cast
 
@@ -13,13 +15,46 @@ from ceil_dlp.detectors.image_detector import (
     get_doctr_heavy_image_analyzer,
     get_image_analyzer,
     get_tesseract_image_analyzer,
+    ocr_concurrency,
+)
+from ceil_dlp.detectors.pdf_detector import PDFIUM_LOCK, detect_pii_in_pdf_pages
+from ceil_dlp.detectors.presidio_adapter import (
+    detect_with_presidio_ensemble,
+    get_pii_type_to_entities,
 )
-from ceil_dlp.detectors.pdf_detector import detect_pii_in_pdf
-from ceil_dlp.detectors.presidio_adapter import get_pii_type_to_entities
 from ceil_dlp.utils import image_to_pil_image
 
 logger = logging.getLogger(__name__)
 
+# Scale redacted PDF pages are rendered at (3x = ~216 DPI)
+PDF_RENDER_SCALE = 3
+
+# JPEG quality of redacted PDF pages, which are embedded as page-sized images
+PDF_PAGE_JPEG_QUALITY = 85
+
+
+@lru_cache(maxsize=9)  # One per OCR engine (1-3) and NER strength (1-3)
+def _get_image_redactor(ocr_type: int, ner_strength: int) -> ImageRedactorEngine:
+    """Get a cached ImageRedactorEngine for an OCR engine and NER strength.
+
+    Args:
+        ocr_type: OCR engine type (1=docTR, 2=tesseract, 3=heavy docTR)
+        ner_strength: NER model strength (1, 2, or 3)
+
+    Returns:
+        ImageRedactorEngine wrapping the matching cached image analyzer
+    """
+    if ocr_type == 1:
+        analyzer = get_image_analyzer(ner_strength=ner_strength)
+    elif ocr_type == 2:
+        analyzer = get_tesseract_image_analyzer(ner_strength=ner_strength)
+    elif ocr_type == 3:
+        analyzer = get_doctr_heavy_image_analyzer(ner_strength=ner_strength)
+    else:
+        raise ValueError(f"Invalid ocr_type: {ocr_type}. Must be 1, 2, or 3.")
+
+    return ImageRedactorEngine(image_analyzer_engine=analyzer)
+
 
 def _redact_with_ocr_engine(
     image: Image.Image,
@@ -38,16 +73,8 @@ def _redact_with_ocr_engine(
     Returns:
         Redacted image
     """
-    if ocr_type == 1:
-        analyzer = get_image_analyzer(ner_strength=ner_strength)
-    elif ocr_type == 2:
-        analyzer = get_tesseract_image_analyzer(ner_strength=ner_strength)
-    elif ocr_type == 3:
-        analyzer = get_doctr_heavy_image_analyzer(ner_strength=ner_strength)
-    else:
-        raise ValueError(f"Invalid ocr_type: {ocr_type}. Must be 1, 2, or 3.")
-
-    engine = ImageRedactorEngine(image_analyzer_engine=analyzer)
+    # Engines are reused across calls, e.g. for every page of a PDF
+    engine = _get_image_redactor(ocr_type, ner_strength)
     return cast(
         Image.Image,
         engine.redact(
@@ -58,6 +85,12 @@ def _redact_with_ocr_engine(
     )
 
 
+@lru_cache(maxsize=256)
+def _redaction_tag(pii_type: str) -> str:
+    """Get the tag a PII type is masked with, e.g. [REDACTED_EMAIL] for email."""
+    return f"[REDACTED_{pii_type.upper()}]"
+
+
 def _apply_redaction_to_text(
     text: str, detections: dict[str, list[tuple[str, int, int]]]
 ) -> tuple[str, dict[str, list[str]]]:
@@ -72,9 +105,7 @@ def _apply_redaction_to_text(
         Tuple of (redacted_text, redacted_items) where redacted_items maps
         PII type to list of redacted values
     """
-    # Collect all matches with their types, sorted by position (reverse order)
-    # This allows us to process all matches at once, maintaining correct positions
-    # Presidio handles overlap removal internally, so we don't need to do it here
+    # Collect all matches with their types so they can be applied in a single forward pass
     all_matches: list[tuple[str, tuple[str, int, int]]] = []  # (pii_type, (text, start, end))
     redacted_items: dict[str, list[str]] = {}
 
@@ -88,15 +119,25 @@ def _apply_redaction_to_text(
             for match in matches:
                 all_matches.append((pii_type, match))
 
-    # Sort by start position in reverse order (process from end to start)
-    # This ensures positions remain valid as we replace text
-    all_matches.sort(key=lambda x: x[1][1], reverse=True)
+    # Sort by start position, longest match first on ties, so overlaps resolve
+    # deterministically: the earliest match names the tag, then the longest
+    all_matches.sort(key=lambda x: (x[1][1], -x[1][2]))
 
-    # Apply all redactions in one pass
-    redacted_text = text
+    # Build the redacted text from the slices between matches instead of re-slicing
+    # the whole string once per match
+    parts: list[str] = []
+    cursor = 0
     for pii_type, (_matched_text, start, end) in all_matches:
-        replacement = f"[REDACTED_{pii_type.upper()}]"
-        redacted_text = redacted_text[:start] + replacement + redacted_text[end:]
+        if start < cursor:
+            # Overlaps a match that was already redacted: merge it into that match's
+            # tag, so any part of it past the cursor is still removed
+            cursor = max(cursor, end)
+            continue
+        parts.append(text[cursor:start])
+        parts.append(_redaction_tag(pii_type))
+        cursor = end
+    parts.append(text[cursor:])
+    redacted_text = "".join(parts)
 
     return redacted_text, redacted_items
 
@@ -128,8 +169,6 @@ def redact_text(
         Tuple of (redacted_text, redacted_items) where redacted_items maps
         PII type to list of redacted values
     """
-    from ceil_dlp.detectors.presidio_adapter import detect_with_presidio_ensemble
-
     # If detections are provided, use them directly (backward compatibility)
     if detections is not None:
         return _apply_redaction_to_text(text, detections)
@@ -143,6 +182,73 @@ def redact_text(
     return _apply_redaction_to_text(text, detections)
 
 
+def _validate_strengths(ocr_strength: int, ner_strength: int) -> None:
+    """Raise ValueError unless both OCR and NER strengths are 1, 2, or 3."""
+    if ner_strength not in (1, 2, 3):
+        raise ValueError(
+            f"ner_strength must be 1, 2, or 3, got {ner_strength}. "
+            "Use 1 for en_core_web_lg, 2 for spaCy+transformer ensemble, "
+            "or 3 for spaCy+transformer+GLiNER ensemble."
+        )
+
+    if ocr_strength not in (1, 2, 3):
+        raise ValueError(
+            f"ocr_strength must be 1, 2, or 3, got {ocr_strength}. "
+            "Use 1 for light docTR only, 2 for light docTR+Tesseract, "
+            "or 3 for all three including heavy docTR."
+        )
+
+
+def _redact_pil_image(
+    image: Image.Image,
+    pii_types: list[str] | None,
+    ocr_strength: int,
+    ner_strength: int,
+) -> Image.Image:
+    """
+    Redact PII in a PIL image, returning the redacted PIL image.
+
+    This is the core of redact_image, without decoding the input or encoding the result,
+    so callers that already work with PIL images (e.g. PDF pages) skip both.
+
+    Args:
+        image: Image to redact
+        pii_types: Optional list of PII types to redact. If None, redacts all detected PII.
+        ocr_strength: Number of OCR models to use (see redact_image)
+        ner_strength: NER model strength (see redact_image)
+
+    Returns:
+        Redacted image
+    """
+    _validate_strengths(ocr_strength, ner_strength)
+
+    # Convert our PII type names to Presidio entity names
+    # Create reverse mapping: pii_type -> list of Presidio entity names
+    pii_type_to_entities = get_pii_type_to_entities()
+
+    entities_to_redact: list[str] = []
+    for pii_type in pii_types if pii_types else []:
+        entities = pii_type_to_entities.get(pii_type)
+        if entities is None:
+            raise ValueError(f"PII type {pii_type} not found in mapping")
+        entities_to_redact.extend(entities)
+
+    # Ensemble approach: For each NER model, run all OCR passes
+    # This catches PII that any single model or OCR engine might miss
+    redacted_image_pil: Image.Image = image
+
+    for ner_model in range(1, ner_strength + 1):
+        for ocr_step in range(1, ocr_strength + 1):
+            redacted_image_pil = _redact_with_ocr_engine(
+                redacted_image_pil,
+                ocr_type=ocr_step,
+                ner_strength=ner_model,
+                entities_to_redact=entities_to_redact,
+            )
+
+    return redacted_image_pil
+
+
 def redact_image(
     image_data: bytes | str | Path | Image.Image,
     pii_types: list[str] | None = None,
@@ -177,19 +283,7 @@ def redact_image(
     Returns:
         Redacted image as bytes (same format as input)
     """
-    if ner_strength not in (1, 2, 3):
-        raise ValueError(
-            f"ner_strength must be 1, 2, or 3, got {ner_strength}. "
-            "Use 1 for en_core_web_lg, 2 for spaCy+transformer ensemble, "
-            "or 3 for spaCy+transformer+GLiNER ensemble."
-        )
-
-    if ocr_strength not in (1, 2, 3):
-        raise ValueError(
-            f"ocr_strength must be 1, 2, or 3, got {ocr_strength}. "
-            "Use 1 for light docTR only, 2 for light docTR+Tesseract, "
-            "or 3 for all three including heavy docTR."
-        )
+    _validate_strengths(ocr_strength, ner_strength)
 
     try:
         image: Image.Image = image_to_pil_image(image_data)
@@ -199,31 +293,9 @@ def redact_image(
         raise ValueError(f"Invalid image_data type: {type(image_data)}") from e
 
     try:
-        # Convert our PII type names to Presidio entity names
-        # Create reverse mapping: pii_type -> list of Presidio entity names
-        pii_type_to_entities = get_pii_type_to_entities()
-
-        entities_to_redact: list[str] = []
-        for pii_type in pii_types if pii_types else []:
-            entities = pii_type_to_entities.get(pii_type)
-            if entities is None:
-                raise ValueError(f"PII type {pii_type} not found in mapping")
-            entities_to_redact.extend(entities)
-
-        # Ensemble approach: For each NER model, run all OCR passes
-        # This catches PII that any single model or OCR engine might miss
-        redacted_image_pil: Image.Image = image
-
-        for ner_model in range(1, ner_strength + 1):
-            for ocr_step in range(1, ocr_strength + 1):
-                redacted_image_pil = _redact_with_ocr_engine(
-                    redacted_image_pil,
-                    ocr_type=ocr_step,
-                    ner_strength=ner_model,
-                    entities_to_redact=entities_to_redact,
-                )
-
-        final_redacted_image_pil: Image.Image = redacted_image_pil
+        final_redacted_image_pil = _redact_pil_image(
+            image, pii_types=pii_types, ocr_strength=ocr_strength, ner_strength=ner_strength
+        )
 
         # Convert back to bytes
         output = io.BytesIO()
@@ -236,6 +308,126 @@ def redact_image(
         raise ValueError(f"Error redacting image: {e}") from e
 
 
+def _append_image_page(
+    pdf: pdfium.PdfDocument, image: Image.Image, width: float, height: float
+) -> None:
+    """
+    Append a page showing an image to a PDF, with the image filling the whole page.
+
+    Args:
+        pdf: PDF document to append the page to
+        image: Page image
+        width: Page width in PDF points
+        height: Page height in PDF points
+    """
+    # pdfium embeds JPEG data as-is (DCTDecode), so the page is encoded exactly once
+    jpeg = io.BytesIO()
+    rgb_image = image.convert("RGB") if image.mode != "RGB" else image
+    rgb_image.save(jpeg, format="JPEG", quality=PDF_PAGE_JPEG_QUALITY, optimize=True)
+    jpeg.seek(0)
+
+    page = pdf.new_page(width, height)
+    image_obj = pdfium.PdfImage.new(pdf)
+    image_obj.load_jpeg(jpeg, inline=True)
+    # Image objects are drawn into the unit square, so scale it up to the page size
+    image_obj.set_matrix(pdfium.PdfMatrix().scale(width, height))
+    page.insert_obj(image_obj)
+    page.gen_content()
+
+
+def _redact_open_pdf(
+    pdf: pdfium.PdfDocument,
+    pdf_data: bytes | str | Path,
+    pii_types: list[str] | None,
+    ocr_strength: int,
+    ner_strength: int,
+) -> bytes | None:
+    """
+    Redact the pages with PII of an open PDF, see redact_pdf.
+
+    Returns:
+        Redacted PDF as bytes, or None if there is nothing to redact or no page could be
+        redacted, in which case the original PDF should be kept.
+    """
+    # Detect PII in PDF, page by page
+    enabled_types = set(pii_types) if pii_types else None
+    pages_with_pii = set(detect_pii_in_pdf_pages(pdf_data, enabled_types=enabled_types))
+
+    if not pages_with_pii:
+        # No PII detected
+        return None
+
+    # NOTE(jadidbourbaki): Redaction approach is to: Render then Redact then Stitch
+    # In other words, we render each page with PII to an image,
+    # then redact the PII in each rendered image,
+    # then stitch the redacted images and the untouched pages back together into a new PDF.
+    # Trade-offs:
+    # The good part is that it handles both text and image-based PII, works for scanned PDFs
+    # The bad part is that it rasterizes pages with PII (loses text selectability, may
+    # increase file size) and some PDF features may be lost (forms, annotations, etc.).
+
+    def redact_page(page_num: int, pil_image: Image.Image) -> Image.Image:
+        try:
+            # Redact PII in the rendered page image using Presidio, keeping it as a
+            # PIL image rather than encoding and decoding it again
+            return _redact_pil_image(
+                pil_image,
+                pii_types=pii_types,
+                ocr_strength=ocr_strength,
+                ner_strength=ner_strength,
+            )
+        except Exception as page_error:
+            # If redaction fails, keep the original page render
+            logger.warning(f"Error redacting PDF page {page_num}: {page_error}")
+            return pil_image
+
+    # OCR and NER dominate and pages are independent, so pages are redacted concurrently.
+    # pdfium isn't thread-safe, so pages are rendered one at a time under PDFIUM_LOCK, and
+    # each page is handed to the pool as soon as it is rendered so rendering overlaps
+    # the redaction of earlier pages
+    workers = min(len(pages_with_pii), ocr_concurrency()) or 1
+    redacted_futures: dict[int, Future[Image.Image]] = {}
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ceil-dlp-ocr") as pool:
+        for page_num in sorted(pages_with_pii):
+            try:
+                with PDFIUM_LOCK:
+                    # Render at high quality for redaction, in RGB byte order so PIL takes
+                    # the pixels as they are instead of swapping them from pdfium's default
+                    # BGR. PIL copies RGB pixels, so the bitmap can be closed right away
+                    bitmap = pdf[page_num].render(scale=PDF_RENDER_SCALE, rev_byteorder=True)
+                    pil_image = bitmap.to_pil()
+                    bitmap.close()
+            except Exception as render_error:
+                # If rendering fails, skip this page rather than keep its PII
+                logger.error(f"Could not process PDF page {page_num}, skipping: {render_error}")
+                continue
+            redacted_futures[page_num] = pool.submit(redact_page, page_num, pil_image)
+    redacted_pages = {page_num: future.result() for page_num, future in redacted_futures.items()}
+
+    # Build the output PDF with pdfium: pages without PII are copied over natively, and
+    # redacted pages are embedded as page-sized images
+    with PDFIUM_LOCK:
+        output_pdf = pdfium.PdfDocument.new()
+        try:
+            for page_num in range(len(pdf)):
+                if page_num in redacted_pages:
+                    width, height = pdf[page_num].get_size()
+                    _append_image_page(output_pdf, redacted_pages[page_num], width, height)
+                elif page_num not in pages_with_pii:
+                    output_pdf.import_pages(pdf, [page_num])
+
+            if not len(output_pdf):
+                # No pages were successfully processed
+                logger.warning("No pages could be redacted, returning original PDF")
+                return None
+
+            output_bytes = io.BytesIO()
+            output_pdf.save(output_bytes)
+            return output_bytes.getvalue()
+        finally:
+            output_pdf.close()
+
+
 def redact_pdf(
     pdf_data: bytes | str | Path,
     pii_types: list[str] | None = None,
@@ -247,9 +439,9 @@ def redact_pdf(
 
     This function:
     1. Detects PII in the PDF (text and images)
-    2. Renders each page to identify PII locations
+    2. Renders each page with PII to identify PII locations
     3. Overlays black rectangles to redact detected PII
-    4. Returns the redacted PDF as bytes
+    4. Returns the redacted PDF as bytes, with pages without PII kept as they were
 
     Args:
         pdf_data: PDF as bytes, file path (str), or Path object
@@ -264,100 +456,34 @@ def redact_pdf(
     """
     try:
         # Load PDF
-        if isinstance(pdf_data, (str, Path)):
-            pdf = pdfium.PdfDocument(pdf_data)
-        elif isinstance(pdf_data, bytes):
-            pdf = pdfium.PdfDocument(io.BytesIO(pdf_data))
-        else:
-            raise ValueError(f"Invalid pdf_data type: {type(pdf_data)}")
-
-        # Detect PII in PDF
-        enabled_types = set(pii_types) if pii_types else None
-        detections = detect_pii_in_pdf(pdf_data, enabled_types=enabled_types)
-
-        if not detections:
-            # No PII detected, return original
-            pdf.close()
-            if isinstance(pdf_data, bytes):
-                return pdf_data
+        with PDFIUM_LOCK:
+            if isinstance(pdf_data, (str, Path)):
+                pdf = pdfium.PdfDocument(pdf_data)
+            elif isinstance(pdf_data, bytes):
+                pdf = pdfium.PdfDocument(io.BytesIO(pdf_data))
             else:
-                with open(pdf_data, "rb") as f:
-                    return f.read()
-
-        # NOTE(jadidbourbaki): Redaction approach is to: Render then Redact then Stitch
-        # In other words, we render each page to an image,
-        # then redact the PII in each rendered image,
-        # then stitch the redacted images back together into a new PDF.
-        # Trade-offs:
-        # The good part is that it handles both text and image-based PII, works for scanned PDFs
-        # The bad part is that it rasterizes PDF (loses text selectability, may increase file size)
-        # and some PDF features may be lost (forms, annotations, etc.).
-
-        redacted_pages: list[Image.Image] = []
+                raise ValueError(f"Invalid pdf_data type: {type(pdf_data)}")
+        try:
+            redacted_pdf = _redact_open_pdf(
+                pdf,
+                pdf_data,
+                pii_types=pii_types,
+                ocr_strength=ocr_strength,
+                ner_strength=ner_strength,
+            )
+        finally:
+            # Also closes the pages that are still open
+            with PDFIUM_LOCK:
+                pdf.close()
 
-        for page_num in range(len(pdf)):
-            try:
-                page = pdf[page_num]
-
-                # Render page to image at high quality for redaction
-                # Use higher scale for better quality (3x = ~216 DPI)
-                bitmap = page.render(scale=3)
-                pil_image = bitmap.to_pil()
-
-                # Redact PII in the rendered page image using Presidio
-                redacted_image_bytes = redact_image(
-                    pil_image,
-                    pii_types=pii_types,
-                    ocr_strength=ocr_strength,
-                    ner_strength=ner_strength,
-                )
-                redacted_image = Image.open(io.BytesIO(redacted_image_bytes))
-
-                redacted_pages.append(redacted_image)
-
-            except Exception as page_error:
-                logger.warning(f"Error redacting PDF page {page_num}: {page_error}")
-                # If redaction fails, try to render original page
-                try:
-                    bitmap = page.render(scale=3)
-                    redacted_pages.append(bitmap.to_pil())
-                except Exception:
-                    # If rendering also fails, skip this page
-                    logger.error(f"Could not process PDF page {page_num}, skipping")
-                    continue
-
-        pdf.close()
-
-        if not redacted_pages:
-            # No pages were successfully processed, return original
-            logger.warning("No pages could be redacted, returning original PDF")
+        if redacted_pdf is None:
+            # Nothing to redact, return original
             if isinstance(pdf_data, bytes):
                 return pdf_data
             else:
                 with open(pdf_data, "rb") as f:
                     return f.read()
-
-        # Create new PDF from redacted page images using PIL
-        # PIL can directly create PDFs from images
-        output_bytes = io.BytesIO()
-
-        # Convert all images to RGB mode (PDF requires RGB, not RGBA)
-        rgb_pages = []
-        for img in redacted_pages:
-            rgb_img = img.convert("RGB") if img.mode != "RGB" else img
-            rgb_pages.append(rgb_img)
-
-        # Save first image as PDF and append the rest
-        if rgb_pages:
-            rgb_pages[0].save(
-                output_bytes,
-                format="PDF",
-                save_all=True,
-                append_images=rgb_pages[1:] if len(rgb_pages) > 1 else [],
-                resolution=216.0,  # Match our 3x scale rendering (~216 DPI)
-            )
-
-        return output_bytes.getvalue()
+        return redacted_pdf
 
     except Exception as e:
         logger.error(f"Error redacting PDF: {e}", exc_info=True)
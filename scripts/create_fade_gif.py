@@ -7,9 +7,25 @@ useful for README demonstrations.
 
 import argparse
 import sys
+from collections.abc import Iterator
 from pathlib import Path
+from typing import Any
 
-from PIL import Image
+import numpy as np
+from PIL import Image, features
+
+
+def downscale(image: Image.Image, size: tuple[int, int]) -> Image.Image:
+    """Downscale an RGB image with area averaging, using OpenCV if it is installed.
+
+    Area averaging (OpenCV's INTER_AREA) is the recommended filter for shrinking images and
+    is several times faster than Lanczos. Falls back to PIL's Lanczos without OpenCV.
+    """
+    try:
+        import cv2
+    except ImportError:
+        return image.resize(size, Image.Resampling.LANCZOS)
+    return Image.fromarray(cv2.resize(np.asarray(image), size, interpolation=cv2.INTER_AREA))
 
 
 def create_fade_gif(
@@ -46,8 +62,8 @@ def create_fade_gif(
         new_height = int(original.size[1] * ratio)
         new_size = (max_width, new_height)
         print(f"Resizing images to {new_size} (max_width={max_width})", file=sys.stderr)
-        original = original.resize(new_size, Image.Resampling.LANCZOS)
-        redacted = redacted.resize(new_size, Image.Resampling.LANCZOS)
+        original = downscale(original, new_size)
+        redacted = downscale(redacted, new_size)
 
     # Ensure both images are the same size
     if original.size != redacted.size:
@@ -57,61 +73,132 @@ def create_fade_gif(
         )
         redacted = redacted.resize(original.size, Image.Resampling.LANCZOS)
 
-    # Create frames for the animation
-    animation_frames = []
+    # Blend in integer arithmetic on arrays converted once, rather than having Image.blend
+    # re-read both images for every frame. Each frame is original + difference * i / frames,
+    # floored like Image.blend truncates. int16 holds difference * i for up to 128 frames
+    original_pixels = np.asarray(original, dtype=np.int16 if frames <= 128 else np.int32)
+    difference = np.asarray(redacted, dtype=original_pixels.dtype) - original_pixels
+    scratch = np.empty_like(difference)
+
+    def blend(step: int) -> Image.Image:
+        """Blend step / frames of the way from the original to the redacted image."""
+        np.multiply(difference, step, out=scratch)
+        np.floor_divide(scratch, frames, out=scratch)
+        np.add(scratch, original_pixels, out=scratch)
+        return Image.fromarray(scratch.astype(np.uint8))
+
+    # The fade back to the original walks the same blends in reverse, so each blend is
+    # computed once. fade[i] is i / frames of the way from original to redacted
+    fade = [original, *(blend(step) for step in range(1, frames)), redacted]
 
-    # Pause at original (show original for a moment)
-    for _ in range(pause_frames):
-        animation_frames.append(original.copy())
+    # Create frames for the animation, as indices into fade, with each frame's duration
+    animation_frames: list[int] = []
+    durations: list[int] = []
+
+    # Pause at original (show original for a moment). The pause is a single frame shown
+    # pause_frames times as long, rather than identical copies the encoder would re-encode
+    if pause_frames:
+        animation_frames.append(0)
+        durations.append(duration * pause_frames)
 
     # Fade from original to redacted
     for i in range(frames):
-        alpha = i / frames
-        # Blend images
-        blended = Image.blend(original, redacted, alpha)
-        animation_frames.append(blended)
+        animation_frames.append(i)
+        durations.append(duration)
 
     # Pause at redacted (show redacted for a moment)
-    for _ in range(pause_frames):
-        animation_frames.append(redacted.copy())
+    if pause_frames:
+        animation_frames.append(frames)
+        durations.append(duration * pause_frames)
 
     # Fade back from redacted to original (optional - creates a loop effect)
     for i in range(frames):
-        alpha = (frames - i) / frames
-        blended = Image.blend(original, redacted, alpha)
-        animation_frames.append(blended)
+        animation_frames.append(frames - i)
+        durations.append(duration)
 
     # Save as animated GIF with optimization
     if use_palette:
         # Use palette mode for better compression (smaller file size)
-        # Convert frames to palette mode for smaller file size
-        palette_frames = []
-        for frame in animation_frames:
-            # Convert to palette mode with reduced colors for better compression
-            # Fewer colors = smaller file size (default: 128, can go as low as 16-32)
-            palette_frame = frame.convert(
-                "P", palette=Image.Palette.ADAPTIVE, colors=palette_colors
+        # All frames share a single palette, which the GIF encoder writes once as the global
+        # color table instead of a local palette per frame. Every frame is a blend of the
+        # original and redacted images, so the palette is built once from a montage of the two
+        # and the half-way blend, and each frame is only mapped onto it.
+        # Fewer colors = smaller file size (default: 128, can go as low as 16-32)
+        montage = Image.fromarray(
+            np.vstack([np.asarray(image) for image in (original, fade[frames // 2], redacted)])
+        )
+        # Index 0 is reserved for transparency, so the palette gets one color fewer.
+        # libimagequant (pngquant's quantizer) picks better palettes than Pillow's median cut
+        # when Pillow is built with it
+        method = Image.Quantize.LIBIMAGEQUANT if features.check("libimagequant") else None
+        palette_image = montage.quantize(colors=palette_colors - 1, method=method)
+        quantized_palette = palette_image.getpalette()
+        if quantized_palette is None:
+            raise ValueError("Quantized image has no palette")
+        palette = [0, 0, 0] + quantized_palette[: 3 * (palette_colors - 1)]
+
+        # Consecutive frames differ in few pixels, so every frame after the first only draws
+        # the pixels that changed and leaves the rest transparent over the previous frame.
+        # The long runs of the transparent index compress far better than repeated pixels.
+        # Frames are quantized as the encoder asks for them, and each blend only once, as
+        # the fade back reuses the palette indices of the fade forward
+        original_indices = np.asarray(original.quantize(palette=palette_image)) + 1
+        quantized: dict[int, np.ndarray] = {0: original_indices}
+
+        # Blends only differ from the original where the redaction changed pixels, so each
+        # blend maps just the box around those pixels onto the palette, over the original's
+        # indices. This also keeps dithering from shimmering outside the redacted areas
+        changed_rows = np.flatnonzero(difference.any(axis=(1, 2)))
+        changed_columns = np.flatnonzero(difference.any(axis=(0, 2)))
+
+        def quantize(step: int) -> np.ndarray:
+            if not changed_rows.size:
+                return original_indices
+            top, bottom = changed_rows[0], changed_rows[-1] + 1
+            left, right = changed_columns[0], changed_columns[-1] + 1
+            changed_box = fade[step].crop((left, top, right, bottom))
+            indices = original_indices.copy()
+            indices[top:bottom, left:right] = (
+                np.asarray(changed_box.quantize(palette=palette_image)) + 1
             )
-            palette_frames.append(palette_frame)
+            return indices
+
+        def diff_frames() -> Iterator[Image.Image]:
+            previous_indices = None
+            for step in animation_frames:
+                if step not in quantized:
+                    quantized[step] = quantize(step)
+                indices = quantized[step]
+                diff_indices = indices.copy()
+                if previous_indices is not None:
+                    diff_indices[indices == previous_indices] = 0
+                previous_indices = indices
+                save_frame = Image.fromarray(diff_indices)
+                save_frame.putpalette(palette)
+                yield save_frame
 
-        save_frames = palette_frames
+        save_frames = diff_frames()
+        # Disposal 1 draws each frame over the previous one
+        save_options: dict[str, Any] = {"transparency": 0, "disposal": 1}
     else:
         # Keep RGB mode for better quality (larger file size)
-        save_frames = animation_frames
+        save_frames = (fade[step] for step in animation_frames)
+        save_options = {}
 
-    save_frames[0].save(
+    next(save_frames).save(
         output_path,
         save_all=True,
-        append_images=save_frames[1:],
-        duration=duration,
+        append_images=save_frames,
+        duration=durations,
         loop=0,  # Loop forever
         optimize=True,  # Enable optimization
+        **save_options,
     )
 
     print(f"Created fade GIF: {output_path}")
     print(f"  Frames: {len(animation_frames)}")
-    print(f"  Duration per frame: {duration}ms")
-    print(f"  Total animation time: ~{len(animation_frames) * duration / 1000:.1f}s")
+    print(f"  Duration per frame: {duration}ms ({duration * pause_frames}ms for pauses)")
+    print(f"  Total animation time: ~{sum(durations) / 1000:.1f}s")
 
 
 def main() -> None:
@@ -0,0 +1,70 @@
+"""Tests for docTR OCR engine."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ceil_dlp.detectors.doctr_ocr import DocTROCREngine, get_ocr_device
+
+
+def test_get_ocr_device(monkeypatch):
+    """Test OCR device selection from environment and CUDA availability."""
+    monkeypatch.setenv("CEIL_DLP_OCR_DEVICE", "cuda:1")
+    assert get_ocr_device() == "cuda:1"
+
+    monkeypatch.delenv("CEIL_DLP_OCR_DEVICE")
+    with patch("torch.cuda.is_available", return_value=False):
+        assert get_ocr_device() == "cpu"
+    with patch("torch.cuda.is_available", return_value=True):
+        assert get_ocr_device() == "cuda"
+
+
+def test_doctr_model_loaded_once_on_device(monkeypatch):
+    """Test that the docTR model is loaded lazily, once, and moved to the OCR device."""
+    monkeypatch.setenv("CEIL_DLP_OCR_DEVICE", "cpu")
+    engine = DocTROCREngine()
+    with patch("ceil_dlp.detectors.doctr_ocr.ocr_predictor") as mock_predictor:
+        model = engine.model
+        assert engine.model is model
+    mock_predictor.assert_called_once()
+    mock_predictor.return_value.to.assert_called_once_with("cpu")
+    assert model is mock_predictor.return_value.to.return_value
+
+
+def test_perform_ocr_batch_single_model_call():
+    """Test that batch OCR makes one model call and maps each page to its own image size."""
+    from types import SimpleNamespace
+
+    from PIL import Image
+
+    def page(word):
+        geometry = ((0.5, 0.5), (1.0, 1.0))
+        word = SimpleNamespace(value=word, geometry=geometry, confidence=0.9)
+        line = SimpleNamespace(geometry=geometry, words=[word])
+        return SimpleNamespace(blocks=[SimpleNamespace(geometry=geometry, lines=[line])])
+
+    engine = DocTROCREngine()
+    engine._model = mock_model = MagicMock()
+    mock_model.return_value = SimpleNamespace(pages=[page("first"), page("second")])
+    images = [Image.new("RGB", (100, 50)), Image.new("RGB", (400, 200))]
+
+    results = engine.perform_ocr_batch(images)
+
+    mock_model.assert_called_once()
+    assert [result["text"] for result in results] == [["first"], ["second"]]
+    assert [result["left"] for result in results] == [[50], [200]]
+    assert [result["width"] for result in results] == [[50], [200]]
+    assert engine.perform_ocr_batch([]) == []
+
+
+def test_perform_ocr_batch_raises_on_failure():
+    """Test that batch OCR raises on failure, while single-image OCR returns no words."""
+    from PIL import Image
+
+    engine = DocTROCREngine()
+    engine._model = MagicMock(side_effect=RuntimeError("OCR model failed"))
+    image = Image.new("RGB", (100, 50))
+
+    with pytest.raises(RuntimeError, match="OCR model failed"):
+        engine.perform_ocr_batch([image])
+    assert engine.perform_ocr(image)["text"] == []
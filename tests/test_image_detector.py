@@ -1,10 +1,16 @@
 """Tests for image PII detection."""
 
 import io
+from unittest.mock import patch
 
 from PIL import Image
 
-from ceil_dlp.detectors.image_detector import detect_pii_in_image
+from ceil_dlp.detectors.image_detector import (
+    MAX_OCR_IMAGE_SIDE,
+    _prepare_image_for_ocr,
+    detect_pii_in_image,
+    detect_pii_in_images,
+)
 from ceil_dlp.utils import create_image_with_text
 
 
@@ -141,3 +147,145 @@ def test_detect_pii_in_image_ocr_error_handling():
     # Even if OCR fails or returns no results, it should return a dict (may be empty)
     detections = detect_pii_in_image(img_bytes.getvalue())
     assert isinstance(detections, dict)
+
+
+def test_prepare_image_for_ocr():
+    """Test that large images are downscaled and unusual modes normalized for OCR."""
+    large = Image.new("RGB", (4000, 3000), color="white")
+    prepared = _prepare_image_for_ocr(large)
+    assert max(prepared.size) == MAX_OCR_IMAGE_SIDE
+    assert prepared.size == (2000, 1500)
+    # Original image is left untouched
+    assert large.size == (4000, 3000)
+
+    cmyk = Image.new("CMYK", (100, 100))
+    assert _prepare_image_for_ocr(cmyk).mode == "L"
+
+    small = Image.new("RGB", (100, 100), color="white")
+    assert _prepare_image_for_ocr(small) is small
+
+
+def test_detect_pii_in_images_batches_in_order():
+    """Test that multi-image detection OCRs uncached images in one batch, in input order."""
+    from ceil_dlp.detectors import image_detector
+
+    image_detector._image_detection_cache.clear()
+
+    def image_bytes(width):
+        output = io.BytesIO()
+        Image.new("RGB", (width, 50), color="white").save(output, format="PNG")
+        return output.getvalue()
+
+    def fake_analyze_images(images):
+        return [
+            {"email": [(str(image.width), 0, 1)]} if image.width != 200 else {} for image in images
+        ]
+
+    first, second, third = image_bytes(100), image_bytes(200), image_bytes(300)
+    with patch(
+        "ceil_dlp.detectors.image_detector._analyze_images", side_effect=fake_analyze_images
+    ) as mock_analyze:
+        results = detect_pii_in_images([first, second, b"not an image", third])
+        # Previously analyzed images come from the cache
+        cached = detect_pii_in_images([third, first], enabled_types={"email"})
+
+    assert results == [{"email": [("100", 0, 1)]}, {}, {}, {"email": [("300", 0, 1)]}]
+    assert cached == [{"email": [("300", 0, 1)]}, {"email": [("100", 0, 1)]}]
+    mock_analyze.assert_called_once()
+    assert len(mock_analyze.call_args.args[0]) == 3
+    assert detect_pii_in_images([]) == []
+    image_detector._image_detection_cache.clear()
+
+
+def test_detect_pii_in_image_does_not_cache_ocr_failures():
+    """Test that an image whose OCR failed is OCR'd again when it is sent again."""
+    from ceil_dlp.detectors import image_detector
+
+    image_detector._image_detection_cache.clear()
+    image_bytes = create_image_with_text("Contact me at john@example.com")
+    email = {"email": [("[email_detected_in_image]", 14, 30)]}
+
+    with patch(
+        "ceil_dlp.detectors.image_detector._analyze_images",
+        side_effect=[RuntimeError("OCR model failed"), [email]],
+    ) as mock_analyze:
+        failed = detect_pii_in_image(image_bytes)
+        retried = detect_pii_in_image(image_bytes)
+        cached = detect_pii_in_image(image_bytes)
+
+    assert failed == {}
+    assert retried == cached == email
+    assert mock_analyze.call_count == 2
+    image_detector._image_detection_cache.clear()
+
+
+def test_detect_pii_in_images_does_not_cache_ocr_failures():
+    """Test that images whose batch OCR failed are OCR'd again when they are sent again."""
+    from ceil_dlp.detectors import image_detector
+
+    image_detector._image_detection_cache.clear()
+
+    def image_bytes(width):
+        output = io.BytesIO()
+        Image.new("RGB", (width, 50), color="white").save(output, format="PNG")
+        return output.getvalue()
+
+    email = {"email": [("[email_detected_in_image]", 0, 16)]}
+    images = [image_bytes(100), image_bytes(200)]
+    with patch(
+        "ceil_dlp.detectors.image_detector._analyze_images",
+        side_effect=[RuntimeError("OCR model failed"), [email, {}]],
+    ) as mock_analyze:
+        failed = image_detector.try_detect_pii_in_images(images)
+        retried = detect_pii_in_images(images)
+
+    assert failed == [None, None]
+    assert retried == [email, {}]
+    assert mock_analyze.call_count == 2
+    image_detector._image_detection_cache.clear()
+
+
+def test_ocr_concurrency(monkeypatch):
+    """Test that CEIL_DLP_OCR_CONCURRENCY bounds the number of images OCR'd at once."""
+    from ceil_dlp.detectors.image_detector import ocr_concurrency
+
+    monkeypatch.delenv("CEIL_DLP_OCR_CONCURRENCY", raising=False)
+    assert ocr_concurrency() >= 1
+    monkeypatch.setenv("CEIL_DLP_OCR_CONCURRENCY", "3")
+    assert ocr_concurrency() == 3
+    monkeypatch.setenv("CEIL_DLP_OCR_CONCURRENCY", "0")
+    assert ocr_concurrency() == 1
+    monkeypatch.setenv("CEIL_DLP_OCR_CONCURRENCY", "many")
+    assert ocr_concurrency() >= 1
+
+
+def test_detect_pii_in_image_disabled(monkeypatch):
+    """Test that image detection is skipped when disabled via environment variable."""
+    monkeypatch.setenv("CEIL_DLP_ENABLE_IMAGE_PII", "0")
+    with patch("ceil_dlp.detectors.image_detector.get_image_analyzer") as mock_get_analyzer:
+        assert detect_pii_in_image(create_image_with_text("john@example.com")) == {}
+        assert detect_pii_in_images([b"first", b"second"]) == [{}, {}]
+        mock_get_analyzer.assert_not_called()
+
+
+def test_detect_pii_in_image_caches_repeated_images():
+    """Test that repeated images are served from the detection cache."""
+    from ceil_dlp.detectors import image_detector
+
+    image_detector._image_detection_cache.clear()
+    image_bytes = create_image_with_text("Contact me at john@example.com")
+    detections = {"email": [("[email_detected_in_image]", 14, 30)], "person": []}
+
+    with patch(
+        "ceil_dlp.detectors.image_detector._analyze_image", return_value=detections
+    ) as mock_analyze:
+        first = detect_pii_in_image(image_bytes)
+        first["email"].append(("mutated", 0, 1))
+        second = detect_pii_in_image(image_bytes, enabled_types={"email"})
+        # PIL images are keyed on their pixels
+        detect_pii_in_image(Image.open(io.BytesIO(image_bytes)))
+        detect_pii_in_image(Image.open(io.BytesIO(image_bytes)))
+
+    assert second == {"email": [("[email_detected_in_image]", 14, 30)]}
+    assert mock_analyze.call_count == 2
+    image_detector._image_detection_cache.clear()
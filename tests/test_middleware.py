@@ -1,11 +1,12 @@
 """Tests for middleware/LiteLLM integration."""
 
+from typing import Any
 from unittest.mock import patch
 
 import pytest
 import yaml
 
-from ceil_dlp.config import Config, Policy
+from ceil_dlp.config import Config, ModelRules, Policy
 from ceil_dlp.middleware import CeilDLPHandler
 
 
@@ -41,6 +42,19 @@ def test_middleware_init_with_config_path(tmp_path):
     assert handler.config.policies["email"].action == "block"
 
 
+def test_middleware_init_warmup():
+    """Test that warmup runs in a background thread only when enabled."""
+    with patch("ceil_dlp.middleware.threading.Thread") as mock_thread:
+        CeilDLPHandler()
+        mock_thread.assert_not_called()
+
+        CeilDLPHandler(config=Config(warmup=True, ner_strength=2))
+        mock_thread.assert_called_once()
+        assert mock_thread.call_args.kwargs["kwargs"]["ner_strength"] == 2
+        assert mock_thread.call_args.kwargs["daemon"] is True
+        mock_thread.return_value.start.assert_called_once()
+
+
 def test_middleware_extract_text_from_messages():
     """Test text extraction from LiteLLM messages."""
     handler = CeilDLPHandler()
@@ -195,6 +209,26 @@ async def test_middleware_pre_call_hook_disabled_policy():
     assert result == data
 
 
+def test_middleware_detection_limited_to_enabled_policies():
+    """Test that detection only looks for types with an enabled policy, and none without one."""
+    config = Config()
+    config.policies["email"] = Policy(action="mask")
+    config.policies["phone"] = Policy(action="block", enabled=False)
+    assert CeilDLPHandler(config=config).enabled_types == {"email"}
+    # An enabled default policy can act on any type
+    config.default_policy = Policy(action="observe")
+    assert CeilDLPHandler(config=config).enabled_types is None
+
+    config = Config()
+    config.policies["email"] = Policy(action="mask", enabled=False)
+    handler = CeilDLPHandler(config=config)
+    messages = [{"role": "user", "content": "My email is john@example.com"}]
+    with patch("ceil_dlp.middleware.detect_pii_in_text_batch") as mock_detect:
+        detections, *_ = handler._process_pii_detection(messages, "gpt-4")
+    mock_detect.assert_not_called()
+    assert detections == {}
+
+
 @pytest.mark.asyncio
 async def test_middleware_pre_call_hook_no_policy():
     """Test pre-call hook with PII type that has no policy."""
@@ -289,7 +323,7 @@ def test_middleware_extract_text_empty_strings():
 def test_middleware_replace_text_in_messages_multimodal():
     """Test text replacement in multimodal messages."""
     handler = CeilDLPHandler()
-    messages = [
+    messages: list[dict[str, Any]] = [
         {
             "role": "user",
             "content": [
@@ -298,21 +332,126 @@ def test_middleware_replace_text_in_messages_multimodal():
             ],
         }
     ]
-    modified = handler._replace_text_in_messages(messages, "john@example.com", "[REDACTED_EMAIL]")
+    segments = handler._extract_text_segments(messages)
+    assert segments == [(0, 0, "My email is john@example.com")]
+    modified = handler._replace_text_in_messages(
+        messages, segments, ["My email is [REDACTED_EMAIL]"]
+    )
     assert "[REDACTED_EMAIL]" in str(modified)
     # Image should be preserved
     assert "image" in str(modified)
+    # The original messages are left untouched
+    assert messages[0]["content"][0]["text"] == "My email is john@example.com"
 
 
 def test_middleware_replace_text_in_string_messages():
     """Test text replacement when message is a string."""
     handler = CeilDLPHandler()
     messages = ["My email is john@example.com"]
-    modified = handler._replace_text_in_messages(messages, "john@example.com", "[REDACTED_EMAIL]")
+    segments = handler._extract_text_segments(messages)
+    modified = handler._replace_text_in_messages(
+        messages, segments, ["My email is [REDACTED_EMAIL]"]
+    )
     assert len(modified) == 1
     assert modified[0]["content"] == "My email is [REDACTED_EMAIL]"
 
 
+@pytest.mark.asyncio
+async def test_middleware_mask_across_multiple_messages():
+    """Test that masking rewrites each message that contains PII."""
+    config = Config()
+    config.policies["email"] = Policy(action="mask")
+    handler = CeilDLPHandler(config=config)
+    messages = [
+        {"role": "system", "content": "Reply to jane@example.com"},
+        {
+            "role": "user",
+            "content": [
+                {"type": "text", "text": "No PII here"},
+                {"type": "text", "text": "My email is john@example.com"},
+            ],
+        },
+    ]
+    # Each text segment is detected separately, with offsets into that segment
+    segment_detections = [
+        {"email": [("jane@example.com", 9, 25)]},
+        {},
+        {"email": [("john@example.com", 12, 28)]},
+    ]
+
+    with patch(
+        "ceil_dlp.middleware.detect_pii_in_text_batch", return_value=segment_detections
+    ) as mock_detect:
+        result = await handler.async_pre_call_hook(
+            user_api_key_dict=None,
+            cache=None,
+            data={"model": "gpt-4", "messages": messages},
+            call_type="completion",
+        )
+
+    assert mock_detect.call_args.args[0] == [
+        "Reply to jane@example.com",
+        "No PII here",
+        "My email is john@example.com",
+    ]
+
+    assert isinstance(result, dict)
+    assert result["messages"][0]["content"] == "Reply to [REDACTED_EMAIL]"
+    assert result["messages"][1]["content"][0]["text"] == "No PII here"
+    assert result["messages"][1]["content"][1]["text"] == "My email is [REDACTED_EMAIL]"
+
+
+@pytest.mark.asyncio
+async def test_middleware_skips_detection_without_pii_anchors():
+    """Test that text-only requests with no PII anchors skip detection entirely."""
+    handler = CeilDLPHandler()
+    messages = [{"role": "user", "content": "sounds good, thanks a lot"}]
+    data = {"model": "gpt-4", "messages": messages}
+
+    with patch.object(handler, "_detect_pii") as mock_detect:
+        result = await handler.async_pre_call_hook(
+            user_api_key_dict=None,
+            cache=None,
+            data=data,
+            call_type="completion",
+        )
+
+    assert result == data
+    mock_detect.assert_not_called()
+
+
+def test_middleware_detects_text_and_images_concurrently():
+    """Test that text detection overlaps image detection instead of running before it."""
+    import threading
+
+    handler = CeilDLPHandler()
+    # Each detector waits for the other, which only succeeds if they run at the same time
+    barrier = threading.Barrier(2, timeout=10)
+    email = {"email": [("john@example.com", 0, 16)]}
+
+    def fake_detect_texts(texts, **_kwargs):
+        barrier.wait()
+        return [email for _ in texts]
+
+    def fake_detect_images(images, **_kwargs):
+        barrier.wait()
+        return [{}, email][: len(images)]
+
+    with (
+        patch("ceil_dlp.middleware.detect_pii_in_text_batch", side_effect=fake_detect_texts),
+        patch("ceil_dlp.middleware.try_detect_pii_in_images", side_effect=fake_detect_images),
+    ):
+        (detections, segment_detections, image_hits, pdf_hits), complete = (
+            handler._detect_pii_uncached(["john@example.com"], [b"image-1", b"image-2"], [])
+        )
+
+    assert segment_detections == [email]
+    assert image_hits == [(1, email)]
+    assert pdf_hits == []
+    assert len(detections["email"]) == 2
+    assert complete
+
+
 def test_middleware_create_handler():
     """Test create_handler factory function."""
     from ceil_dlp.middleware import create_handler
@@ -379,6 +518,40 @@ async def test_middleware_mode_observe():
     assert result == data
 
 
+@pytest.mark.asyncio
+async def test_middleware_mode_observe_logs_applicable_policies():
+    """Test observe mode audits only the detected types whose policy applies to the model."""
+    config = Config(mode="observe")
+    config.policies["email"] = Policy(action="mask")
+    config.policies["phone"] = Policy(action="block", models=ModelRules(allow=["gpt-4"]))
+    handler = CeilDLPHandler(config=config)
+    messages = [{"role": "user", "content": "Email john@example.com or call 555-123-4567"}]
+    data = {"model": "gpt-4", "messages": messages, "litellm_call_id": "test123"}
+    detections = {
+        "email": [("john@example.com", 6, 22)],
+        "phone": [("555-123-4567", 31, 43)],
+        "url": [("example.com", 11, 22)],
+    }
+
+    with (
+        patch.object(handler, "_detect_pii", return_value=(detections, [detections], [], [])),
+        patch.object(handler.audit_logger, "log_detection") as mock_log,
+    ):
+        result = await handler.async_pre_call_hook(
+            user_api_key_dict=None,
+            cache=None,
+            data=data,
+            call_type="completion",
+        )
+
+    assert result == data
+    # The phone policy is skipped for the allow-listed model, and url has no policy
+    mock_log.assert_called_once()
+    assert mock_log.call_args.kwargs["pii_type"] == "email"
+    assert mock_log.call_args.kwargs["action"] == "observe"
+    assert mock_log.call_args.kwargs["redacted_items"] == ["john@example.com"]
+
+
 @pytest.mark.asyncio
 async def test_middleware_mode_enforce():
     """Test enforce mode: block and mask according to policies."""
@@ -694,12 +867,12 @@ async def test_middleware_image_redaction_in_messages():
     # Mock image detection to return email PII
     with (
         patch(
-            "ceil_dlp.middleware.detect_pii_in_text",
-            return_value={},
+            "ceil_dlp.middleware.detect_pii_in_text_batch",
+            return_value=[],
         ),
         patch(
-            "ceil_dlp.middleware.detect_pii_in_image",
-            return_value={"email": [("[email_detected_in_image]", 0, 1)]},
+            "ceil_dlp.middleware.try_detect_pii_in_images",
+            return_value=[{"email": [("[email_detected_in_image]", 0, 1)]}],
         ),
     ):
         # Create images_with_pii list
@@ -917,8 +1090,8 @@ async def test_middleware_pre_call_hook_with_image_pii():
 
     # Mock image detection
     with patch(
-        "ceil_dlp.middleware.detect_pii_in_image",
-        return_value={"email": [("[email_detected_in_image]", 0, 1)]},
+        "ceil_dlp.middleware.try_detect_pii_in_images",
+        return_value=[{"email": [("[email_detected_in_image]", 0, 1)]}],
     ):
         # Mock redact_image to return modified bytes
         redacted_bytes = b"redacted"
@@ -973,8 +1146,8 @@ async def test_middleware_pre_call_hook_image_blocked():
 
     # Mock image detection to find credit card
     with patch(
-        "ceil_dlp.middleware.detect_pii_in_image",
-        return_value={"credit_card": [("[credit_card_detected_in_image]", 0, 1)]},
+        "ceil_dlp.middleware.try_detect_pii_in_images",
+        return_value=[{"credit_card": [("[credit_card_detected_in_image]", 0, 1)]}],
     ):
         result = await handler.async_pre_call_hook(
             user_api_key_dict=None,
@@ -1071,6 +1244,17 @@ def test_middleware_extract_pdfs_from_messages_pdf_url():
     assert pdfs[0] == pdf_bytes
 
 
+def test_decode_data_url():
+    """Test decoding the base64 payload of data URLs."""
+    from ceil_dlp.middleware import _decode_data_url
+
+    assert _decode_data_url("data:application/pdf;base64,JVBERi0=") == b"%PDF-"
+    assert _decode_data_url("data:image/png;base64,") == b""
+    # No payload separator, or a payload that isn't base64
+    assert _decode_data_url("data:image/png;base64") is None
+    assert _decode_data_url("data:image/png;base64,invalid_base64!!!") is None
+
+
 def test_middleware_extract_pdfs_from_messages_empty():
     """Test PDF extraction with no PDFs."""
     handler = CeilDLPHandler()
@@ -1126,7 +1310,7 @@ async def test_middleware_pdf_redaction_in_messages():
     ]
 
     # Detect PII in the PDF (real detection, no mock)
-    from ceil_dlp.middleware import detect_pii_in_pdf
+    from ceil_dlp.detectors.pdf_detector import detect_pii_in_pdf
 
     detections = detect_pii_in_pdf(pdf_bytes)
     # Email should be detected in "Contact: john@example.com"
@@ -1172,7 +1356,7 @@ async def test_middleware_pdf_redaction_no_pii_to_mask():
     ]
 
     # PDF has PII but it's not in the mask set
-    from ceil_dlp.middleware import detect_pii_in_pdf
+    from ceil_dlp.detectors.pdf_detector import detect_pii_in_pdf
 
     detections = detect_pii_in_pdf(pdf_bytes)
     assert "email" in detections, "Email should be detected"
@@ -1207,7 +1391,7 @@ async def test_middleware_pdf_redaction_error_handling():
         }
     ]
 
-    from ceil_dlp.middleware import detect_pii_in_pdf
+    from ceil_dlp.detectors.pdf_detector import detect_pii_in_pdf
 
     detections = detect_pii_in_pdf(pdf_bytes)
     pdfs_with_pii = [(pdf_bytes, detections)]
@@ -1252,7 +1436,7 @@ async def test_middleware_pre_call_hook_with_pdf_pii():
     data = {"model": "gpt-4", "messages": messages, "litellm_call_id": "test123"}
 
     # Use real PDF detection and redaction (no mocks)
-    with patch("ceil_dlp.middleware.detect_pii_in_text", return_value={}):
+    with patch("ceil_dlp.middleware.detect_pii_in_text_batch", return_value=[]):
         result = await handler.async_pre_call_hook(
             user_api_key_dict=None,
             cache=None,
@@ -1302,7 +1486,7 @@ async def test_middleware_pre_call_hook_pdf_blocked():
 
     data = {"model": "gpt-4", "messages": messages, "litellm_call_id": "test123"}
 
-    with patch("ceil_dlp.middleware.detect_pii_in_text", return_value={}):
+    with patch("ceil_dlp.middleware.detect_pii_in_text_batch", return_value=[]):
         result = await handler.async_pre_call_hook(
             user_api_key_dict=None,
             cache=None,
@@ -1345,7 +1529,9 @@ def test_middleware_process_pii_detection_with_pdf():
         blocked_types,
         masked_types,
         whistledown_types,
-        text_content,
+        applied_types,
+        segments,
+        segment_detections,
         images_with_pii,
         pdfs_with_pii,
     ) = handler._process_pii_detection(messages, "gpt-4")
@@ -1415,7 +1601,7 @@ def test_middleware_pdf_redaction_document_url_type():
     """Test PDF redaction with document_url type."""
     import base64
 
-    from ceil_dlp.middleware import detect_pii_in_pdf
+    from ceil_dlp.detectors.pdf_detector import detect_pii_in_pdf
     from ceil_dlp.utils import create_pdf_with_text
 
     handler = CeilDLPHandler()
@@ -1455,7 +1641,7 @@ def test_middleware_pdf_redaction_string_file_data():
     """Test PDF redaction with string file data."""
     import base64
 
-    from ceil_dlp.middleware import detect_pii_in_pdf
+    from ceil_dlp.detectors.pdf_detector import detect_pii_in_pdf
     from ceil_dlp.utils import create_pdf_with_text
 
     handler = CeilDLPHandler()
@@ -1762,3 +1948,144 @@ async def test_middleware_whistledown_cache_cleanup():
     # Verify cache was cleared
     stats_after = handler.whistledown_cache.get_stats(request_id)
     assert stats_after["mapping_count"] == 0
+
+
+@pytest.mark.asyncio
+async def test_middleware_pre_call_hook_image_detection_disabled(monkeypatch):
+    """Test that images are not scanned when image detection is disabled."""
+    import base64
+
+    from ceil_dlp.utils import create_image_with_text
+
+    monkeypatch.setenv("CEIL_DLP_ENABLE_IMAGE_PII", "0")
+    handler = CeilDLPHandler()
+    image_base64 = base64.b64encode(create_image_with_text("Card: 4111111111111111")).decode()
+    data = {
+        "model": "gpt-4",
+        "messages": [
+            {
+                "role": "user",
+                "content": [
+                    {
+                        "type": "image_url",
+                        "image_url": {"url": f"data:image/png;base64,{image_base64}"},
+                    }
+                ],
+            }
+        ],
+        "litellm_call_id": "test123",
+    }
+
+    with patch("ceil_dlp.middleware.try_detect_pii_in_images") as mock_detect:
+        result = await handler.async_pre_call_hook(
+            user_api_key_dict=None,
+            cache=None,
+            data=data,
+            call_type="completion",
+        )
+
+    mock_detect.assert_not_called()
+    assert result == data
+
+
+@pytest.mark.asyncio
+async def test_middleware_repeated_payload_reuses_detections():
+    """Test that a repeated payload reuses cached detections but re-applies policies."""
+    config = Config()
+    config.policies["email"] = Policy(action="mask")
+    handler = CeilDLPHandler(config=config)
+    messages = [{"role": "user", "content": "My email is john@example.com"}]
+    email_match = ("john@example.com", 12, 28)
+
+    with patch(
+        "ceil_dlp.middleware.detect_pii_in_text_batch", return_value=[{"email": [email_match]}]
+    ) as mock_detect:
+        for _ in range(2):
+            result = await handler.async_pre_call_hook(
+                user_api_key_dict=None,
+                cache=None,
+                data={"model": "gpt-4", "messages": [dict(m) for m in messages]},
+                call_type="completion",
+            )
+            assert isinstance(result, dict)
+            assert "[REDACTED_EMAIL]" in result["messages"][0]["content"]
+        assert mock_detect.call_count == 1
+
+        # Policies aren't cached, so a policy change applies to the cached detections
+        config.policies["email"] = Policy(action="block")
+        result = await handler.async_pre_call_hook(
+            user_api_key_dict=None,
+            cache=None,
+            data={"model": "gpt-4", "messages": [dict(m) for m in messages]},
+            call_type="completion",
+        )
+        assert isinstance(result, str)
+        assert mock_detect.call_count == 1
+
+        # Different content is detected again
+        await handler.async_pre_call_hook(
+            user_api_key_dict=None,
+            cache=None,
+            data={"model": "gpt-4", "messages": [{"role": "user", "content": "Other content"}]},
+            call_type="completion",
+        )
+        assert mock_detect.call_count == 2
+
+
+def test_middleware_conversation_history_reuses_segment_detections():
+    """Test that earlier turns of a conversation aren't detected again on the next turn."""
+    handler = CeilDLPHandler()
+    detected_batches = []
+
+    def fake_detect_texts(texts, **_kwargs):
+        detected_batches.append(list(texts))
+        return [{"email": [("a@b.co", 0, 6)]} if "@" in text else {} for text in texts]
+
+    first_turn = ["a@b.co is my email"]
+    second_turn = [*first_turn, "Noted.", "Thanks", "Thanks"]
+    with patch("ceil_dlp.middleware.detect_pii_in_text_batch", side_effect=fake_detect_texts):
+        handler._detect_pii(first_turn, [], [])
+        detections, segment_detections, _, _ = handler._detect_pii(second_turn, [], [])
+
+    # Only the new segments are detected, and repeated segments only once
+    assert detected_batches == [first_turn, ["Noted.", "Thanks"]]
+    assert segment_detections == [{"email": [("a@b.co", 0, 6)]}, {}, {}, {}]
+    assert detections == {"email": [("a@b.co", 0, 6)]}
+
+
+def test_middleware_does_not_cache_failed_detections():
+    """Test that a payload whose image or PDF detection failed is detected again."""
+    handler = CeilDLPHandler()
+    email = {"email": [("[email_detected_in_image]", 0, 1)]}
+
+    with patch(
+        "ceil_dlp.middleware.try_detect_pii_in_images", side_effect=[[None], [email]]
+    ) as mock_detect:
+        failed = handler._detect_pii([], [b"image"], [])
+        retried = handler._detect_pii([], [b"image"], [])
+        cached = handler._detect_pii([], [b"image"], [])
+    assert failed == ({}, [], [], [])
+    assert retried == cached == (email, [], [(b"image", email)], [])
+    assert mock_detect.call_count == 2
+
+    with patch(
+        "ceil_dlp.middleware.try_detect_pii_in_pdf", side_effect=[({}, False), (email, True)]
+    ) as mock_detect:
+        failed = handler._detect_pii([], [], [b"pdf"])
+        retried = handler._detect_pii([], [], [b"pdf"])
+        cached = handler._detect_pii([], [], [b"pdf"])
+    assert failed == ({}, [], [], [])
+    assert retried == cached == (email, [], [], [(b"pdf", email)])
+    assert mock_detect.call_count == 2
+
+
+def test_package_exports_resolve_lazily():
+    """Test that the lazy package-level exports resolve to the functions and classes."""
+    import ceil_dlp
+    from ceil_dlp import middleware, model_warmup
+
+    assert ceil_dlp.CeilDLPHandler is CeilDLPHandler
+    assert ceil_dlp.create_handler is middleware.create_handler
+    assert ceil_dlp.warmup is model_warmup.warmup
+    with pytest.raises(AttributeError):
+        _ = ceil_dlp.not_a_public_name
@@ -1,6 +1,6 @@
 """Tests for model matching utility."""
 
-from ceil_dlp.detectors.model_matcher import matches_model
+from ceil_dlp.detectors.model_matcher import compile_model_patterns, matches_model
 
 
 def test_matches_model_exact_match():
@@ -54,3 +54,32 @@ def test_matches_model_no_regex_chars():
     assert matches_model("openai/gpt-4", "openai-gpt-4") is False
     assert matches_model("simple-model", "simple-model") is True
     assert matches_model("simple-model", "different-model") is False
+
+
+def test_compile_model_patterns_matches_like_matches_model():
+    """Test that compiled pattern lists agree with matching each pattern separately."""
+    pattern_lists = [
+        ("openai/gpt-4", "anthropic/.*"),
+        ("self-hosted/.*", "local/.*", "model-[a-z0-9]+"),
+        ("(openai)/gpt-.*", "[invalid", "exact/model"),
+        ("(?i)openai/.*", "anthropic/claude"),
+        ("[invalid",),
+    ]
+    models = [
+        "openai/gpt-4",
+        "OPENAI/gpt-4",
+        "anthropic/claude",
+        "self-hosted/llama2",
+        "local/ollama",
+        "model-v1",
+        "model-V1",
+        "exact/model",
+        "other/model",
+    ]
+    for patterns in pattern_lists:
+        compiled = compile_model_patterns(patterns)
+        for model in models:
+            expected = any(matches_model(model, pattern) for pattern in patterns)
+            assert compiled.matches(model) is expected, (patterns, model)
+
+    assert compile_model_patterns(("openai/.*",)) is compile_model_patterns(("openai/.*",))
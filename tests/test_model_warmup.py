@@ -0,0 +1,47 @@
+"""Tests for model warmup."""
+
+from unittest.mock import patch
+
+from ceil_dlp.model_warmup import warmup
+
+
+def test_warmup_loads_analyzers_up_to_strength():
+    """Test that warmup loads and exercises every analyzer in the ensemble."""
+    with (
+        patch("ceil_dlp.model_warmup.get_analyzer") as mock_get_analyzer,
+        patch("ceil_dlp.model_warmup.get_image_analyzer") as mock_get_image_analyzer,
+    ):
+        warmup(ner_strength=2)
+
+    assert [c.kwargs["ner_strength"] for c in mock_get_analyzer.call_args_list] == [1, 2]
+    mock_get_analyzer.return_value.analyze.assert_called_with(text="warmup", language="en")
+    mock_get_image_analyzer.assert_not_called()
+
+
+def test_warmup_include_image():
+    """Test that warmup loads the image analyzer and OCR model when requested."""
+    with (
+        patch("ceil_dlp.model_warmup.get_analyzer"),
+        patch("ceil_dlp.model_warmup.get_image_analyzer") as mock_get_image_analyzer,
+        patch("ceil_dlp.model_warmup.get_doctr_ocr_engine") as mock_get_ocr_engine,
+    ):
+        warmup(include_image=True)
+
+    mock_get_image_analyzer.assert_called_once()
+    mock_get_ocr_engine.assert_called_once()
+
+
+def test_warmup_logs_errors(caplog):
+    """Test that warmup failures are logged instead of raised."""
+    import logging
+
+    with (
+        caplog.at_level(logging.WARNING),
+        patch("ceil_dlp.model_warmup.get_analyzer", side_effect=RuntimeError("no model")),
+    ):
+        # Returns normally instead of raising
+        warmup()
+
+    assert [(record.levelno, record.getMessage()) for record in caplog.records] == [
+        (logging.WARNING, "ceil-dlp model warmup failed: no model")
+    ]
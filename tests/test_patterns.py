@@ -74,4 +74,3 @@ def test_position_tracking():
     match = matches[0]
     matched_text, start, end = match
     assert text[start:end] == matched_text
-    assert matched_text in text
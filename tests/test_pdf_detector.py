@@ -1,6 +1,12 @@
 """Tests for PDF PII detection."""
 
-from ceil_dlp.detectors.pdf_detector import detect_pii_in_pdf
+import io
+
+from ceil_dlp.detectors.pdf_detector import (
+    detect_pii_in_pdf,
+    detect_pii_in_pdf_pages,
+    try_detect_pii_in_pdf,
+)
 from ceil_dlp.utils import create_pdf_with_text
 
 
@@ -51,3 +57,106 @@ def test_detect_pii_in_pdf_with_enabled_types():
     # All detected types should be in enabled_types
     for pii_type in detections:
         assert pii_type in enabled_types
+
+
+def test_detect_pii_in_pdf_pages_leaves_out_clean_pages():
+    """Test that per-page detection only reports pages with PII."""
+    from unittest.mock import patch
+
+    import pypdfium2 as pdfium
+
+    pdf = pdfium.PdfDocument.new()
+    for _ in range(3):
+        pdf.new_page(100, 100)
+    buffer = io.BytesIO()
+    pdf.save(buffer)
+    pdf.close()
+
+    email = {"email": [("john@example.com", 0, 16)]}
+    with patch(
+        "ceil_dlp.detectors.pdf_detector.try_detect_pii_in_images", return_value=[{}, email, {}]
+    ):
+        pages = detect_pii_in_pdf_pages(buffer.getvalue())
+    assert list(pages) == [1]
+    assert pages[1]["email"] == [("[email_detected_in_pdf_page_1]", 0, 16)]
+
+
+def test_detect_pii_in_pdf_pages_keeps_pages_whose_ocr_failed():
+    """Test that pages whose image couldn't be scanned are reported as possibly having PII."""
+    from unittest.mock import patch
+
+    import pypdfium2 as pdfium
+
+    pdf = pdfium.PdfDocument.new()
+    for _ in range(3):
+        pdf.new_page(100, 100)
+    buffer = io.BytesIO()
+    pdf.save(buffer)
+    pdf.close()
+
+    with patch(
+        "ceil_dlp.detectors.pdf_detector.try_detect_pii_in_images", return_value=[{}, None, {}]
+    ):
+        pages = detect_pii_in_pdf_pages(buffer.getvalue())
+        merged = try_detect_pii_in_pdf(buffer.getvalue())
+    assert pages == {1: {}}
+    assert merged == ({}, False)
+    assert try_detect_pii_in_pdf(b"not a pdf") == ({}, False)
+
+
+def test_detect_pii_in_pdf_pages_ocr_runs_outside_pdfium_lock():
+    """Test that pdfium calls are serialized while OCR of the pages runs concurrently."""
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+    from unittest.mock import patch
+
+    import pypdfium2 as pdfium
+
+    from ceil_dlp.detectors.pdf_detector import PDFIUM_LOCK
+
+    pdf = pdfium.PdfDocument.new()
+    for _ in range(3):
+        pdf.new_page(100, 100)
+    buffer = io.BytesIO()
+    pdf.save(buffer)
+    pdf.close()
+
+    def pdfium_lock_is_free() -> bool:
+        # Another thread can only take the lock if no thread holds it
+        acquired = []
+
+        def try_lock() -> None:
+            if PDFIUM_LOCK.acquire(blocking=False):
+                PDFIUM_LOCK.release()
+                acquired.append(True)
+
+        thread = threading.Thread(target=try_lock)
+        thread.start()
+        thread.join()
+        return bool(acquired)
+
+    email = {"email": [("john@example.com", 0, 16)]}
+    lock_states: list[bool] = []
+
+    def detect_images(images, enabled_types=None):
+        lock_states.append(pdfium_lock_is_free())
+        return [email for _ in images]
+
+    def detect_images_concurrently(images, enabled_types=None):
+        return [email for _ in images]
+
+    with patch(
+        "ceil_dlp.detectors.pdf_detector.try_detect_pii_in_images", side_effect=detect_images
+    ):
+        assert list(detect_pii_in_pdf_pages(buffer.getvalue())) == [0, 1, 2]
+    assert lock_states and all(lock_states)
+
+    with (
+        patch(
+            "ceil_dlp.detectors.pdf_detector.try_detect_pii_in_images",
+            side_effect=detect_images_concurrently,
+        ),
+        ThreadPoolExecutor(max_workers=4) as pool,
+    ):
+        results = list(pool.map(detect_pii_in_pdf_pages, [buffer.getvalue()] * 8))
+    assert all(list(pages) == [0, 1, 2] for pages in results)
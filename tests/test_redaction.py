@@ -51,6 +51,26 @@ def test_mask_text_multiple_matches():
     assert "[REDACTED_PHONE]" in result
 
 
+def test_redact_text_overlapping_matches():
+    """Test that overlapping matches keep the earliest, then longest, match."""
+    text = "Key: abc-123-def and more"
+    detections = {
+        "api_key": [("abc-123", 5, 12)],
+        "phone": [("abc-123-def", 5, 16), ("123", 9, 12)],
+    }
+    redacted, items = redact_text(text, detections)
+    assert redacted == "Key: [REDACTED_PHONE] and more"
+    assert items == {"api_key": ["abc-123"], "phone": ["abc-123-def", "123"]}
+
+
+def test_redact_text_partially_overlapping_matches():
+    """Test that a match partly overlapping an earlier one is merged into its tag."""
+    text = "Call John Smith Jr today"
+    detections = {"person": [("John Smith", 5, 15), ("Smith Jr", 11, 18)]}
+    redacted, _items = redact_text(text, detections)
+    assert redacted == "Call [REDACTED_PERSON] today"
+
+
 def test_redaction_empty_detections():
     """Test redact_text with empty detections."""
     text = "Normal text"
@@ -133,6 +153,24 @@ def test_redact_image_error_handling_bytes():
         redact_image(invalid_data, ner_strength=1, ocr_strength=1)
 
 
+def test_image_redactor_engine_reused():
+    """Test that image redactor engines are built once per OCR engine and NER strength."""
+    from unittest.mock import patch
+
+    from ceil_dlp.redaction import _get_image_redactor
+
+    _get_image_redactor.cache_clear()
+    with patch("ceil_dlp.redaction.get_image_analyzer") as mock_get_analyzer:
+        engine = _get_image_redactor(1, 1)
+        assert _get_image_redactor(1, 1) is engine
+        mock_get_analyzer.assert_called_once_with(ner_strength=1)
+        assert engine.image_analyzer_engine is mock_get_analyzer.return_value
+    _get_image_redactor.cache_clear()
+
+    with pytest.raises(ValueError, match="Invalid ocr_type"):
+        _get_image_redactor(4, 1)
+
+
 def test_redact_text_empty_all_matches():
     """Test redact_text when all matches are removed (line 86)."""
     # Create detections that will all be removed by overlap removal
@@ -163,6 +201,93 @@ def test_redact_pdf():
     assert len(redacted) > 0
 
 
+def test_redact_pdf_keeps_page_order():
+    """Test that PDF pages are reassembled in page order and only pages with PII are redacted."""
+    from unittest.mock import patch
+
+    import pypdfium2 as pdfium
+
+    # Three blank pages of different widths, so the output page order can be checked
+    pdf = pdfium.PdfDocument.new()
+    for width in (100, 200, 300):
+        pdf.new_page(width, 100)
+    buffer = io.BytesIO()
+    pdf.save(buffer)
+    pdf.close()
+
+    redacted_widths = []
+
+    def fake_redact_image(image, **_kwargs):
+        # Pages are redacted as PIL images, with no encode/decode round-trip
+        assert isinstance(image, Image.Image)
+        redacted_widths.append(image.width)
+        return image
+
+    email = {"email": [("john@example.com", 0, 16)]}
+    with (
+        patch("ceil_dlp.redaction.detect_pii_in_pdf_pages", return_value={0: email, 2: email}),
+        patch("ceil_dlp.redaction._redact_pil_image", side_effect=fake_redact_image),
+    ):
+        redacted = redact_pdf(buffer.getvalue())
+
+    redacted_pdf = pdfium.PdfDocument(redacted)
+    widths = [redacted_pdf[i].get_width() for i in range(len(redacted_pdf))]
+    page_objects = [list(redacted_pdf[i].get_objects()) for i in range(len(redacted_pdf))]
+    redacted_pdf.close()
+    assert widths == [100, 200, 300]
+    # The clean middle page skips the OCR/NER redaction passes and is copied over as-is,
+    # while redacted pages become a single page-sized image
+    assert sorted(redacted_widths) == [300, 900]
+    assert [len(objects) for objects in page_objects] == [1, 0, 1]
+
+
+def test_redact_pdf_redacts_pages_when_text_detection_fails():
+    """Test that a page whose text can't be scanned is redacted instead of copied over as-is."""
+    from unittest.mock import patch
+
+    import pypdfium2 as pdfium
+
+    # A one-page PDF with a text layer, so the page goes through batched text detection
+    content = b"BT /F1 12 Tf 10 50 Td (john@example.com) Tj ET"
+    pdf_bytes = (
+        b"%PDF-1.4\n"
+        b"1 0 obj<</Type/Catalog/Pages 2 0 R>>endobj\n"
+        b"2 0 obj<</Type/Pages/Kids[3 0 R]/Count 1>>endobj\n"
+        b"3 0 obj<</Type/Page/Parent 2 0 R/MediaBox[0 0 200 100]/Contents 4 0 R"
+        b"/Resources<</Font<</F1<</Type/Font/Subtype/Type1/BaseFont/Helvetica>>>>>>>>endobj\n"
+        b"4 0 obj<</Length "
+        + str(len(content)).encode()
+        + b">>stream\n"
+        + content
+        + b"\nendstream endobj\ntrailer<</Root 1 0 R>>\n%%EOF"
+    )
+
+    redacted_pages = []
+
+    def fake_redact_image(image, **_kwargs):
+        redacted_pages.append(image)
+        return image
+
+    with (
+        patch(
+            "ceil_dlp.detectors.pdf_detector.detect_pii_in_text_batch",
+            side_effect=RuntimeError("analyzer unavailable"),
+        ),
+        patch("ceil_dlp.detectors.pdf_detector.try_detect_pii_in_images", return_value=[{}]),
+        patch("ceil_dlp.redaction._redact_pil_image", side_effect=fake_redact_image),
+    ):
+        redacted = redact_pdf(pdf_bytes)
+
+    redacted_pdf = pdfium.PdfDocument(redacted)
+    textpage = redacted_pdf[0].get_textpage()
+    redacted_text = textpage.get_text_bounded()
+    textpage.close()
+    redacted_pdf.close()
+    # The page is rasterized and redacted rather than copied over with its text layer
+    assert len(redacted_pages) == 1
+    assert "john@example.com" not in redacted_text
+
+
 def test_redact_pdf_from_path(tmp_path):
     """Test PDF redaction from file path."""
     from ceil_dlp.utils import create_pdf_with_text
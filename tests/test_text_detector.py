@@ -1,6 +1,13 @@
 """Tests for PII detection."""
 
-from ceil_dlp.detectors.text_detector import detect_pii_in_text
+from unittest.mock import patch
+
+from ceil_dlp.detectors.text_detector import (
+    detect_pii_in_text,
+    detect_pii_in_text_batch,
+    has_pii_in_text,
+    may_have_pii_in_text,
+)
 
 
 def test_credit_card_detection():
@@ -216,3 +223,50 @@ def test_enabled_types_with_new_presidio_types():
     assert "person" in detections or "location" in detections
     # Should not detect email (not in enabled_types)
     assert "email" not in detections
+
+
+def test_detect_pii_in_text_batch_matches_single():
+    """Test that batch detection returns the same results as per-text detection."""
+    texts = [
+        "Contact me at john@example.com",
+        "My SSN is 536-22-1234",
+        "This is just normal text",
+    ]
+    batch_detections = detect_pii_in_text_batch(texts, enabled_types={"email", "ssn"})
+    assert len(batch_detections) == len(texts)
+    for text, detections in zip(texts, batch_detections, strict=True):
+        assert detections == detect_pii_in_text(text, enabled_types={"email", "ssn"})
+    assert "email" in batch_detections[0]
+    assert "ssn" in batch_detections[1]
+
+
+def test_detect_pii_in_text_batch_empty():
+    """Test batch detection with no texts and with no supported types."""
+    assert detect_pii_in_text_batch([]) == []
+    assert detect_pii_in_text_batch(["john@example.com"], enabled_types={"unknown"}) == [{}]
+
+
+def test_has_pii_in_text_stops_at_first_model():
+    """Test that has_pii_in_text stops at the first model that finds an enabled type."""
+    per_model = {1: {"email": [("john@example.com", 0, 16)]}, 2: {}, 3: {}}
+    with patch(
+        "ceil_dlp.detectors.presidio_adapter._detect_with_presidio",
+        side_effect=lambda _text, ner_strength: per_model[ner_strength],
+    ) as mock_detect:
+        assert has_pii_in_text("john@example.com", ner_strength=3)
+        assert mock_detect.call_count == 1
+
+        # Types that are not enabled don't count, so every model runs
+        mock_detect.reset_mock()
+        assert not has_pii_in_text("john@example.com", enabled_types={"ssn"}, ner_strength=3)
+        assert mock_detect.call_count == 3
+
+    assert not has_pii_in_text("john@example.com", enabled_types={"unknown"})
+
+
+def test_may_have_pii_in_text():
+    """Test the cheap pre-detection check for texts that can't contain PII."""
+    assert may_have_pii_in_text("reach me at john@example.com")
+    assert may_have_pii_in_text("Please ask John Smith")
+    assert not may_have_pii_in_text("sounds good, thanks a lot")
+    assert not may_have_pii_in_text("john@example.com", enabled_types={"unknown"})